@@ -11,7 +11,7 @@ Features:
 - Multi-provider AI (Gemini, OpenRouter, Ollama)
 """
 
-APP_VERSION = "0.9.0-beta.30"
+APP_VERSION = "0.9.0-beta.32"
 GITHUB_REPO = "deucebucket/library-manager"  # Your GitHub repo
 
 # Versioning Guide:
@@ -31,13 +31,32 @@ import time
 import sqlite3
 import threading
 import logging
+import functools
+import queue
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 from pathlib import Path
 from datetime import datetime, timedelta
-from flask import Flask, render_template, request, jsonify, redirect, url_for, send_file
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for, send_file
 from audio_tagging import embed_tags_for_path, build_metadata_for_embedding
 
+# Optional: orjson parses/serializes JSON several times faster than stdlib json.
+# Not required - everything falls back to the json module when it's missing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# mutagen reads audio tags; imported once here because the tag readers run per file.
+try:
+    from mutagen import File as MutagenFile
+except ImportError:
+    MutagenFile = None
+
 
 # ============== SEARCH QUEUE / PROGRESS TRACKING ==============
 # Tracks progress of chaos scans and batch operations for UI feedback
@@ -117,11 +136,29 @@ search_progress = SearchProgress()
 
 BOOKDB_LOCAL_PATH = "/mnt/rag_data/bookdb/metadata.db"
 
+def tune_sqlite_connection(conn, read_only=False):
+    """Apply the standard performance PRAGMAs to a fresh SQLite connection.
+
+    Our own library.db gets WAL + synchronous=NORMAL (safe with WAL, avoids an
+    fsync per commit). read_only connections (e.g. the shared BookDB file we
+    don't own) skip anything that changes the file and set query_only instead.
+    """
+    if read_only:
+        conn.execute('PRAGMA query_only=ON')
+    else:
+        conn.execute('PRAGMA journal_mode=WAL')  # Better concurrent access
+        conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')  # 256MB - reads come straight from the mapped file
+    conn.execute('PRAGMA cache_size=-65536')  # ~64MB page cache
+    return conn
+
+
 def get_bookdb_connection():
     """Get a connection to the local BookDB SQLite database."""
     if os.path.exists(BOOKDB_LOCAL_PATH):
         try:
-            return sqlite3.connect(BOOKDB_LOCAL_PATH, timeout=5)
+            return tune_sqlite_connection(sqlite3.connect(BOOKDB_LOCAL_PATH, timeout=5), read_only=True)
         except Exception as e:
             logging.debug(f"Could not connect to local BookDB: {e}")
     return None
@@ -129,6 +166,36 @@ def get_bookdb_connection():
 
 # ============== SMART MATCHING UTILITIES ==============
 
+# Precompiled patterns for the matching helpers below (these run per queue item / API result)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Common stop words that don't help title matching
+TITLE_STOP_WORDS = frozenset({'the', 'a', 'an', 'of', 'and', 'or', 'in', 'to', 'for', 'by', 'part', 'book', 'volume'})
+
+_SERIES_BOOK_COLON_RE = re.compile(r'^(?:The\s+)?(.+?)\s*(?:Series)?,?\s*Book\s+(\d+)\s*[:\s-]+(.+)$', re.IGNORECASE)
+_SERIES_SUFFIX_RE = re.compile(r'\s*Series\s*$', re.IGNORECASE)
+_SERIES_HASH_TITLE_RE = re.compile(r'^(.+?)\s*#(\d+)\s*[:\s-]+(.+)$')
+_SERIES_BOOK_TITLE_RE = re.compile(r'^(.+?)\s+Book\s+(\d+)\s*[:\s-]+(.+)$', re.IGNORECASE)
+_SERIES_BOOK_END_RE = re.compile(r'^(.+?)\s+Book\s+(\d+)\s*$', re.IGNORECASE)
+_SERIES_HASH_END_RE = re.compile(r'^(.+?)\s*#(\d+)\s*$')
+_TITLE_BOOK_PAREN_RE = re.compile(r'^(.+?)\s*\(Book\s+(\d+)\)\s*$', re.IGNORECASE)
+
+# Colon look-alikes that show up in filenames (Windows can't store a real ':')
+_COLON_TRANS = str.maketrans({
+    '\uA789': ':',  # ꞉ MODIFIER LETTER COLON
+    '\uFF1A': ':',  # ： FULLWIDTH COLON
+})
+
+@functools.lru_cache(maxsize=4096)
+def _title_word_set(title):
+    """Normalize a title to its set of meaningful words (cached).
+
+    The same original title is compared against every API candidate, so the
+    lowercase/punctuation/stop-word work is done once per distinct string.
+    """
+    return frozenset(_PUNCT_RE.sub(' ', title.lower()).split()) - TITLE_STOP_WORDS
+
+
 def calculate_title_similarity(title1, title2):
     """
     Calculate word overlap similarity between two titles.
@@ -138,27 +205,19 @@ def calculate_title_similarity(title1, title2):
         return 0.0
 
     # Normalize: lowercase, remove punctuation, split into words
-    def normalize(t):
-        t = t.lower()
-        t = re.sub(r'[^\w\s]', ' ', t)
-        words = set(t.split())
-        # Remove common stop words that don't help matching
-        stop_words = {'the', 'a', 'an', 'of', 'and', 'or', 'in', 'to', 'for', 'by', 'part', 'book', 'volume'}
-        return words - stop_words
-
-    words1 = normalize(title1)
-    words2 = normalize(title2)
+    words1 = _title_word_set(title1)
+    words2 = _title_word_set(title2)
 
     if not words1 or not words2:
         return 0.0
 
     # Calculate Jaccard similarity (intersection over union)
-    intersection = words1 & words2
-    union = words1 | words2
-
-    return len(intersection) / len(union) if union else 0.0
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set never has to be built
+    overlap = len(words1 & words2)
+    return overlap / (len(words1) + len(words2) - overlap)
 
 
+@functools.lru_cache(maxsize=8192)
 def extract_series_from_title(title):
     """
     Extract series name and number from title patterns like:
@@ -168,43 +227,49 @@ def extract_series_from_title(title):
     - "The Expanse #3 - Abaddon's Gate" -> (The Expanse, 3, Abaddon's Gate)
     """
     # Normalize colon-like characters (Windows uses ꞉ instead of : in filenames)
-    normalized = title.replace('꞉', ':').replace('：', ':')  # U+A789 and full-width colon
+    normalized = title.translate(_COLON_TRANS)
+
+    # Every pattern below needs "Book N" or "#N" - skip the regexes for plain titles
+    if '#' not in normalized and 'book' not in normalized.lower():
+        return None, None, title
 
+    # All patterns are anchored at the start, so match() instead of search()
+    # avoids retrying each one at every position of a non-matching title
     # Pattern: "Series Name, Book N: Title" or "Series Name Book N: Title"
     # Also handles "The X Series, Book N: Title"
-    match = re.search(r'^(?:The\s+)?(.+?)\s*(?:Series)?,?\s*Book\s+(\d+)\s*[:\s-]+(.+)$', normalized, re.IGNORECASE)
+    match = _SERIES_BOOK_COLON_RE.match(normalized)
     if match:
         series = match.group(1).strip()
         # Clean up series name (remove trailing "Series" if it got in)
-        series = re.sub(r'\s*Series\s*$', '', series, flags=re.IGNORECASE)
+        series = _SERIES_SUFFIX_RE.sub('', series)
         return series, int(match.group(2)), match.group(3).strip()
 
     # Pattern: "Series #N - Title" or "Series #N: Title"
-    match = re.search(r'^(.+?)\s*#(\d+)\s*[:\s-]+(.+)$', normalized)
+    match = _SERIES_HASH_TITLE_RE.match(normalized)
     if match:
         return match.group(1).strip(), int(match.group(2)), match.group(3).strip()
 
     # Pattern: "Series Book N - Title"
-    match = re.search(r'^(.+?)\s+Book\s+(\d+)\s*[:\s-]+(.+)$', normalized, re.IGNORECASE)
+    match = _SERIES_BOOK_TITLE_RE.match(normalized)
     if match:
         return match.group(1).strip(), int(match.group(2)), match.group(3).strip()
 
     # Pattern: "Series Book N" at END (no subtitle) - e.g., "Dark One Book 1"
     # Series name = title before "Book N", actual title = same as series
-    match = re.search(r'^(.+?)\s+Book\s+(\d+)\s*$', normalized, re.IGNORECASE)
+    match = _SERIES_BOOK_END_RE.match(normalized)
     if match:
         series = match.group(1).strip()
         return series, int(match.group(2)), series  # Title = series name
 
     # Pattern: "Series #N" at END (no subtitle) - e.g., "Mistborn #1"
-    match = re.search(r'^(.+?)\s*#(\d+)\s*$', normalized)
+    match = _SERIES_HASH_END_RE.match(normalized)
     if match:
         series = match.group(1).strip()
         return series, int(match.group(2)), series
 
     # Pattern: "Title (Book N)" - book number in parentheses at end
     # e.g., "Ivypool's Heart (Book 17)" -> extract number, title stays same
-    match = re.search(r'^(.+?)\s*\(Book\s+(\d+)\)\s*$', normalized, re.IGNORECASE)
+    match = _TITLE_BOOK_PAREN_RE.match(normalized)
     if match:
         title_clean = match.group(1).strip()
         return None, int(match.group(2)), title_clean  # Series unknown, just got number
@@ -212,6 +277,11 @@ def extract_series_from_title(title):
     return None, None, title
 
 
+# Folder/file names that are structure or placeholders, never a searchable title
+_GENERIC_TITLE_WORDS = frozenset({'chapter', 'chapters', 'intro', 'introduction', 'prologue', 'epilogue',
+                                  'part', 'track', 'disc', 'disk', 'cd', 'unknown', 'various',
+                                  'untitled', 'audio', 'audiobook', 'book', 'mp3', 'm4b'})
+
 def is_unsearchable_query(title):
     """
     Check if a title is clearly not a book title and shouldn't be searched.
@@ -242,6 +312,10 @@ def is_unsearchable_query(title):
     if re.match(r'^(?:full\s+)?audiobook$', title_lower):
         return True
 
+    # A lone generic word (chapter, intro, track, unknown, ...)
+    if title_lower in _GENERIC_TITLE_WORDS:
+        return True
+
     # Very short titles (1-2 chars) are usually garbage
     if len(title_lower) <= 2:
         return True
@@ -261,19 +335,35 @@ def is_garbage_match(original_title, suggested_title, threshold=0.3):
 
     Threshold of 0.3 means at least 30% word overlap required.
     """
+    garbage, similarity = _garbage_match_score(original_title, suggested_title, threshold)
+    if garbage:
+        logger.info(f"Garbage match rejected: '{original_title}' vs '{suggested_title}' (similarity: {similarity:.2f})")
+    return garbage
+
+
+@functools.lru_cache(maxsize=2048)
+def _long_word_count(title):
+    """Number of whitespace-separated words longer than 2 characters (cached per title)."""
+    return sum(1 for w in title.lower().split() if len(w) > 2)
+
+
+@functools.lru_cache(maxsize=4096)
+def _garbage_match_score(original_title, suggested_title, threshold):
+    """(is_garbage, similarity) for is_garbage_match - cached, since the same
+    title/suggestion pairs come back from several APIs and verification passes."""
     similarity = calculate_title_similarity(original_title, suggested_title)
 
     # If original is very short (1-2 words), be more lenient
-    orig_words = len([w for w in original_title.lower().split() if len(w) > 2])
-    if orig_words <= 2 and similarity >= 0.2:
-        return False
+    if _long_word_count(original_title) <= 2 and similarity >= 0.2:
+        return False, similarity
 
-    if similarity < threshold:
-        logger.info(f"Garbage match rejected: '{original_title}' vs '{suggested_title}' (similarity: {similarity:.2f})")
-        return True
+    return similarity < threshold, similarity
 
-    return False
 
+# NFO author/title lines - NFOs are mostly ASCII art, so only the head is scanned
+_NFO_AUTHOR_RE = re.compile(r'(?:author|by|written by)[:\s]+([^\n\r]+)', re.IGNORECASE)
+_NFO_TITLE_RE = re.compile(r'(?:title|book)[:\s]+([^\n\r]+)', re.IGNORECASE)
+NFO_READ_LIMIT = 64 * 1024  # Bytes - real release info sits well inside this
 
 def extract_folder_metadata(folder_path):
     """
@@ -287,14 +377,30 @@ def extract_folder_metadata(folder_path):
     if not folder.exists():
         return hints
 
+    # One directory pass instead of an exists()/glob() call per candidate file
+    entry_names = set()
+    first_audio = {}  # extension -> first file seen with it
+    nfo_files = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                entry_names.add(entry.name)
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in ('.m4b', '.mp3', '.m4a') and ext not in first_audio and entry.is_file():
+                    first_audio[ext] = entry.path
+                elif ext == '.nfo' and entry.is_file():
+                    nfo_files.append(entry.path)  # Any case: .nfo, .NFO, .Nfo
+    except OSError:
+        pass
+
     # Look for .nfo files (common in audiobook releases)
-    nfo_files = list(folder.glob('*.nfo')) + list(folder.glob('*.NFO'))
     for nfo in nfo_files:
         try:
-            content = nfo.read_text(errors='ignore')
+            with open(nfo, 'rb') as f:
+                content = f.read(NFO_READ_LIMIT).decode('utf-8', errors='ignore')
             # Look for author/title patterns in NFO
-            author_match = re.search(r'(?:author|by|written by)[:\s]+([^\n\r]+)', content, re.IGNORECASE)
-            title_match = re.search(r'(?:title|book)[:\s]+([^\n\r]+)', content, re.IGNORECASE)
+            author_match = _NFO_AUTHOR_RE.search(content)
+            title_match = _NFO_TITLE_RE.search(content)
             if author_match:
                 hints['nfo_author'] = author_match.group(1).strip()
             if title_match:
@@ -305,9 +411,9 @@ def extract_folder_metadata(folder_path):
     # Look for metadata.json or info.json
     for meta_file in ['metadata.json', 'info.json', 'audiobook.json']:
         meta_path = folder / meta_file
-        if meta_path.exists():
+        if meta_file in entry_names:
             try:
-                meta = json.loads(meta_path.read_text())
+                meta = read_json_file(meta_path)
                 if 'author' in meta:
                     hints['meta_author'] = meta['author']
                 if 'title' in meta:
@@ -320,19 +426,18 @@ def extract_folder_metadata(folder_path):
     # Look for desc.txt or description.txt
     for desc_file in ['desc.txt', 'description.txt', 'readme.txt']:
         desc_path = folder / desc_file
-        if desc_path.exists():
+        if desc_file in entry_names:
             try:
-                content = desc_path.read_text(errors='ignore')[:2000]  # First 2KB
-                hints['description'] = content
+                with open(desc_path, errors='ignore') as f:
+                    hints['description'] = f.read(2000)  # First 2000 chars only
             except Exception:
                 pass
 
-    # Check audio file metadata using mutagen (if available)
-    audio_files = list(folder.glob('*.m4b')) + list(folder.glob('*.mp3')) + list(folder.glob('*.m4a'))
-    if audio_files:
+    # Check audio file metadata using mutagen (if available) - prefer m4b, then mp3, then m4a
+    audio_file = first_audio.get('.m4b') or first_audio.get('.mp3') or first_audio.get('.m4a')
+    if audio_file and MutagenFile is not None:
         try:
-            from mutagen import File
-            audio = File(audio_files[0], easy=True)
+            audio = MutagenFile(audio_file, easy=True)
             if audio:
                 if 'albumartist' in audio:
                     hints['audio_author'] = audio['albumartist'][0]
@@ -386,6 +491,8 @@ DEFAULT_CONFIG = {
     "max_requests_per_hour": 30,
     "auto_fix": False,
     "protect_author_changes": True,  # Require approval if author changes completely
+    "parallel_lookup": False,  # Query all metadata APIs at once instead of one after another
+    "scan_workers": 16,  # Concurrent file reads when checking for duplicates during deep scan
     "enabled": True,
     "ebook_management": False,  # Enable ebook organization (Beta)
     "ebook_library_mode": "merge",  # "merge" = same folder as audiobooks, "separate" = own library
@@ -404,6 +511,13 @@ DEFAULT_SECRETS = {
     "gemini_api_key": ""
 }
 
+# Keys that live in secrets.json rather than config.json
+SECRETS_KEYS = ('openrouter_api_key', 'gemini_api_key', 'abs_api_token')
+
+# Keys scrubbed from anything we show back to the user (bug reports, etc.)
+# Includes optional API keys that are stored in config.json
+REDACT_KEYS = SECRETS_KEYS + ('google_books_api_key', 'bookdb_api_key', 'openai_api_key')
+
 
 def init_config():
     """Create default config files if they don't exist."""
@@ -506,37 +620,274 @@ def init_db():
         api_calls INTEGER DEFAULT 0
     )''')
 
+    # API cache table - metadata search results, so rescans skip repeat lookups
+    c.execute('''CREATE TABLE IF NOT EXISTS api_cache (
+        key TEXT PRIMARY KEY,
+        value TEXT,
+        expires_at REAL
+    )''')
+    c.execute('DELETE FROM api_cache WHERE expires_at < ?', (time.time(),))
+
+    # Status lookups drive the stats counts and deep-rescan filters
+    c.execute('CREATE INDEX IF NOT EXISTS idx_books_status ON books(status)')
+    # Queue lookups/joins by book (scanner dedupe, queue listing, removals)
+    c.execute('CREATE INDEX IF NOT EXISTS idx_queue_book_id ON queue(book_id)')
+
     conn.commit()
     conn.close()
 
+class _PooledConnection:
+    """A lease on a pooled sqlite3 connection.
+
+    Behaves like the underlying connection, but close() hands it back to the
+    pool (rolling back anything uncommitted, exactly like a real close would)
+    and makes this lease unusable, so a double close can never give a
+    connection that another thread is using back to the pool. Cursors made
+    through the lease are closed with it, so a stale cursor raises
+    ProgrammingError instead of running on whoever holds the connection next.
+    """
+
+    def __init__(self, pool, conn, generation):
+        self.__dict__.update(_pool=pool, _conn=conn, _generation=generation,
+                             _cursors=weakref.WeakSet())
+
+    def _live(self):
+        conn = self.__dict__['_conn']
+        if conn is None:
+            raise sqlite3.ProgrammingError('Cannot operate on a closed database.')
+        return conn
+
+    def _track(self, cursor):
+        self.__dict__['_cursors'].add(cursor)
+        return cursor
+
+    def cursor(self, *args, **kwargs):
+        return self._track(self._live().cursor(*args, **kwargs))
+
+    def execute(self, *args):
+        return self._track(self._live().execute(*args))
+
+    def executemany(self, *args):
+        return self._track(self._live().executemany(*args))
+
+    def executescript(self, *args):
+        return self._track(self._live().executescript(*args))
+
+    def __getattr__(self, name):
+        return getattr(self._live(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._live(), name, value)
+
+    def __enter__(self):
+        self._live().__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._live().__exit__(*exc)
+
+    def close(self):
+        conn = self.__dict__['_conn']
+        if conn is not None:
+            self.__dict__['_conn'] = None
+            for cursor in list(self.__dict__['_cursors']):
+                try:
+                    cursor.close()
+                except sqlite3.Error:
+                    pass
+            self._pool.release(conn, self.__dict__['_generation'])
+
+    def __del__(self):
+        # A lease that was never closed is a leak: report it, and close the connection
+        # rather than quietly recycling it into the pool
+        conn = self.__dict__.get('_conn')
+        if conn is not None:
+            self.__dict__['_conn'] = None
+            try:
+                logger.warning("Database connection was never closed (leaked get_db() lease)")
+                conn.close()
+            except Exception:
+                pass
+
+
+class _SqlitePool:
+    """Thread-safe LIFO pool of configured library.db connections.
+
+    Opening a connection and re-running the PRAGMA setup costs more than most
+    of the queries this app makes, so idle connections are kept for reuse.
+    """
+
+    def __init__(self, max_idle):
+        self._idle = queue.LifoQueue(maxsize=max_idle)
+        self._generation = 0
+
+    def _connect(self):
+        # Leases move between threads (request -> pool -> worker), never shared concurrently
+        conn = sqlite3.connect(DB_PATH, timeout=30, check_same_thread=False)  # Wait up to 30 seconds for lock
+        return tune_sqlite_connection(conn)
+
+    def acquire(self):
+        generation = self._generation
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        return _PooledConnection(self, conn, generation)
+
+    def release(self, conn, generation):
+        try:
+            if generation != self._generation:
+                raise queue.Full  # Pool was cleared while this was leased (e.g. DB restored)
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+
+    def clear(self):
+        """Close all idle connections and retire any that are currently leased."""
+        self._generation += 1
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_db_pool = _SqlitePool(max_idle=max(4, os.cpu_count() or 1))
+
 def get_db():
-    """Get database connection with timeout to avoid lock issues."""
-    conn = sqlite3.connect(DB_PATH, timeout=30)  # Wait up to 30 seconds for lock
-    conn.row_factory = sqlite3.Row
-    conn.execute('PRAGMA journal_mode=WAL')  # Better concurrent access
-    return conn
+    """Get a pooled database connection (call close() to return it to the pool)."""
+    return _db_pool.acquire()
+
+def with_db(view):
+    """Decorator: open a get_db() connection, pass it as the first argument,
+    and always close it - no matter which return/raise path the view takes."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        conn = get_db()
+        try:
+            return view(conn, *args, **kwargs)
+        finally:
+            conn.close()
+    return wrapper
+
+def fetch_dicts(c, query, params=()):
+    """Run a query and return rows as plain dicts for JSON responses.
+
+    Uses plain tuple rows and zips them with the column names once, instead
+    of building a sqlite3.Row per row and then copying it into a dict.
+    """
+    c.row_factory = None
+    c.execute(query, params)
+    cols = [d[0] for d in c.description]
+    return [dict(zip(cols, row)) for row in c.fetchall()]
+
+def upsert_books(conn, rows, update_names=True, update_status=False):
+    """Insert or update many books rows in one transaction.
+
+    rows is an iterable of (path, current_author, current_title, status).
+    For paths that already exist, author/title are refreshed only when
+    update_names is set (turn it off to keep names stored by earlier fixes),
+    and status only when update_status is set (e.g. marking series folders).
+    """
+    updates = []
+    if update_names:
+        updates.append('current_author=excluded.current_author, current_title=excluded.current_title')
+    if update_status:
+        updates.append('status=excluded.status')
+    updates.append('updated_at=CURRENT_TIMESTAMP')
+    with conn:
+        conn.executemany(
+            'INSERT INTO books (path, current_author, current_title, status) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT(path) DO UPDATE SET ' + ', '.join(updates),
+            rows)
 
 # ============== CONFIG ==============
 
+def loads_json(data):
+    """Parse JSON from str or bytes (uses orjson when available)."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def response_json(resp):
+    """Parse an HTTP response body as JSON straight from its bytes."""
+    return loads_json(resp.content)
+
+def read_json_file(path):
+    """Parse a JSON file (uses orjson when available)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return loads_json(data)
+
+def write_json_file(path, obj):
+    """Write obj as indented JSON (uses orjson when available)."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+# Parsed config cache: (file signature, merged config). load_config() is called
+# on nearly every request and at the start of every worker batch, but the files
+# rarely change - re-read them only when their mtime/size does.
+_config_cache = None
+_config_cache_lock = threading.Lock()
+
+def _config_files_signature():
+    """(mtime_ns, size) of config.json and secrets.json - None for a missing file."""
+    sig = []
+    for path in (CONFIG_PATH, SECRETS_PATH):
+        try:
+            st = os.stat(path)
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+def _copy_config(config):
+    """Copy a config dict deep enough that callers can't mutate the cached one."""
+    return {k: (v.copy() if isinstance(v, (list, dict)) else v) for k, v in config.items()}
+
+def invalidate_config_cache():
+    """Force the next load_config() to re-read the files."""
+    global _config_cache
+    with _config_cache_lock:
+        _config_cache = None
+
 def load_config():
-    """Load configuration and secrets from files."""
+    """Load configuration and secrets (cached until either file changes on disk).
+
+    Config stays live: edits from the Settings page or by hand are picked up on
+    the next call because the file signature changes.
+    """
+    global _config_cache
+    signature = _config_files_signature()
+    with _config_cache_lock:
+        if _config_cache and _config_cache[0] == signature:
+            return _copy_config(_config_cache[1])
+
+    config = _read_config_files()
+    with _config_cache_lock:
+        _config_cache = (signature, config)
+    return _copy_config(config)
+
+def _read_config_files():
+    """Read and merge defaults, config.json and secrets.json."""
     config = DEFAULT_CONFIG.copy()
 
     # Load main config
     if CONFIG_PATH.exists():
         try:
-            with open(CONFIG_PATH) as f:
-                file_config = json.load(f)
-                config.update(file_config)
+            config.update(read_json_file(CONFIG_PATH))
         except Exception as e:
             logger.warning(f"Error loading config: {e}")
 
     # Load secrets (API keys)
     if SECRETS_PATH.exists():
         try:
-            with open(SECRETS_PATH) as f:
-                secrets = json.load(f)
-                config.update(secrets)
+            config.update(read_json_file(SECRETS_PATH))
         except Exception as e:
             logger.warning(f"Error loading secrets: {e}")
 
@@ -545,30 +896,41 @@ def load_config():
 def save_config(config):
     """Save configuration to file (excludes secrets)."""
     # Separate secrets from config
-    secrets_keys = ['openrouter_api_key', 'gemini_api_key', 'abs_api_token']
-    config_only = {k: v for k, v in config.items() if k not in secrets_keys}
-
-    with open(CONFIG_PATH, 'w') as f:
-        json.dump(config_only, f, indent=2)
+    config_only = {k: v for k, v in config.items() if k not in SECRETS_KEYS}
+    write_json_file(CONFIG_PATH, config_only)
+    invalidate_config_cache()
 
 
 def save_secrets(secrets):
     """Save API keys to secrets file."""
-    with open(SECRETS_PATH, 'w') as f:
-        json.dump(secrets, f, indent=2)
+    write_json_file(SECRETS_PATH, secrets)
+    invalidate_config_cache()
 
 def load_secrets():
     """Load API keys from secrets file."""
     if SECRETS_PATH.exists():
         try:
-            with open(SECRETS_PATH) as f:
-                return json.load(f)
+            return read_json_file(SECRETS_PATH)
         except Exception as e:
             logger.warning(f"Error loading secrets: {e}")
     return {}
 
 # ============== DRASTIC CHANGE DETECTION ==============
 
+# Placeholder authors - going FROM these to a real author is NOT drastic
+_PLACEHOLDER_OLD_AUTHORS = frozenset({'unknown', 'various', 'various authors', 'va', 'n/a', 'none',
+                                      'audiobook', 'audiobooks', 'ebook', 'ebooks', 'book', 'books',
+                                      'author', 'authors', 'narrator', 'untitled', 'no author',
+                                      'metadata', 'tmp', 'temp', 'streams', 'cache'})  # System folders too
+
+
+@functools.lru_cache(maxsize=2048)
+def _author_name_parts(name):
+    """Key words of an author name: punctuation removed, single letters dropped (cached)."""
+    clean = _PUNCT_RE.sub(' ', name.lower())
+    return frozenset([p for p in clean.split() if len(p) > 1])
+
+
 def is_drastic_author_change(old_author, new_author):
     """
     Check if an author change is "drastic" (completely different person)
@@ -583,12 +945,7 @@ def is_drastic_author_change(old_author, new_author):
     old_norm = old_author.lower().strip()
     new_norm = new_author.lower().strip()
 
-    # Placeholder authors - going FROM these to a real author is NOT drastic
-    placeholder_authors = {'unknown', 'various', 'various authors', 'va', 'n/a', 'none',
-                           'audiobook', 'audiobooks', 'ebook', 'ebooks', 'book', 'books',
-                           'author', 'authors', 'narrator', 'untitled', 'no author',
-                           'metadata', 'tmp', 'temp', 'streams', 'cache'}  # System folders too
-    if old_norm in placeholder_authors:
+    if old_norm in _PLACEHOLDER_OLD_AUTHORS:
         return False  # Finding the real author is always good
 
 
@@ -597,18 +954,12 @@ def is_drastic_author_change(old_author, new_author):
         return False
 
     # Extract key words (remove common prefixes/suffixes)
-    def get_name_parts(name):
-        # Remove punctuation and split
-        import re
-        clean = re.sub(r'[^\w\s]', ' ', name.lower())
-        parts = [p for p in clean.split() if len(p) > 1]
-        return set(parts)
-
-    old_parts = get_name_parts(old_author)
-    new_parts = get_name_parts(new_author)
+    old_parts = _author_name_parts(old_author)
+    new_parts = _author_name_parts(new_author)
+    overlap = len(old_parts & new_parts)
 
     # If no overlap at all, definitely drastic
-    if not old_parts.intersection(new_parts):
+    if not overlap:
         # Check for initials match (e.g., "J.R.R. Tolkien" vs "Tolkien")
         # Get last names (usually the longest word or last word)
         old_last = max(old_parts, key=len) if old_parts else ""
@@ -619,12 +970,11 @@ def is_drastic_author_change(old_author, new_author):
 
         return True  # Completely different
 
-    # Some overlap - check how much
-    overlap = len(old_parts.intersection(new_parts))
+    # Some overlap - check how much (total > 0 here since overlap > 0)
     total = max(len(old_parts), len(new_parts))
 
     # If less than 30% overlap, consider it drastic
-    if total > 0 and overlap / total < 0.3:
+    if overlap / total < 0.3:
         return True
 
     return False
@@ -643,38 +993,77 @@ def is_placeholder_author(name):
 
 # ============== BOOK METADATA APIs ==============
 
-# Rate limiting for each API (last call timestamp)
+# Shared HTTP session for metadata lookups: keeps TCP/TLS connections alive
+# between calls instead of a fresh handshake per book. Transient gateway
+# errors on GETs are retried; the final status is still returned to callers.
+_HTTP = requests.Session()
+_HTTP.mount('https://', HTTPAdapter(
+    pool_connections=8, pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                      raise_on_status=False)))
+# Identify ourselves to the public APIs (OpenLibrary asks clients to) and ask for JSON everywhere
+_HTTP.headers.update({
+    'User-Agent': f"LibraryManager/{APP_VERSION} (+https://github.com/deucebucket/library-manager)",
+    'Accept': 'application/json',
+})
+
+class TokenBucket:
+    """Thread-safe token bucket: one token per min_delay seconds, up to burst saved up.
+
+    acquire() takes a token under the bucket's own lock - letting the balance go
+    negative to reserve a future slot - and returns how long the caller must
+    sleep, so nobody sleeps while holding the lock.
+    """
+
+    def __init__(self, min_delay, burst=1):
+        self.min_delay = min_delay
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.min_delay)
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens * self.min_delay if self.tokens < 0 else 0.0
+
+
+# Rate limiting for each API: a minimum spacing between calls, no bursts
+# (concurrent lookups still each get their own API's bucket)
 # Based on research:
 # - Audnexus: No docs, small project - 1 req/sec max
 # - OpenLibrary: Had issues with high traffic - 1 req/sec
 # - Google Books: ~1000/day free = ~40/hour - 1 req/2sec
 # - Hardcover: Beta API, be conservative - 1 req/2sec
 API_RATE_LIMITS = {
-    'audnexus': {'last_call': 0, 'min_delay': 1.5},      # 1.5 sec between calls
-    'openlibrary': {'last_call': 0, 'min_delay': 1.5},   # 1.5 sec between calls
-    'googlebooks': {'last_call': 0, 'min_delay': 2.5},   # 2.5 sec between calls (stricter)
-    'hardcover': {'last_call': 0, 'min_delay': 2.5},     # 2.5 sec between calls (beta)
+    'audnexus': TokenBucket(min_delay=1.5),              # 1.5 sec between calls
+    'openlibrary': TokenBucket(min_delay=1.5),           # 1.5 sec between calls
+    'googlebooks': TokenBucket(min_delay=2.5),           # 2.5 sec between calls (stricter)
+    'hardcover': TokenBucket(min_delay=2.5),             # 2.5 sec between calls (beta)
 }
-API_RATE_LOCK = threading.Lock()
 
 def rate_limit_wait(api_name):
-    """Wait if needed to respect rate limits for the given API."""
-    with API_RATE_LOCK:
-        if api_name not in API_RATE_LIMITS:
-            return
-
-        limit_info = API_RATE_LIMITS[api_name]
-        now = time.time()
-        elapsed = now - limit_info['last_call']
-        wait_time = limit_info['min_delay'] - elapsed
-
-        if wait_time > 0:
-            logger.debug(f"Rate limiting {api_name}: waiting {wait_time:.1f}s")
-            time.sleep(wait_time)
+    """Wait if needed to respect rate limits for the given API.
+
+    Each API has its own bucket, so a wait on one API never blocks the others.
+    """
+    bucket = API_RATE_LIMITS.get(api_name)
+    if bucket is None:
+        return
 
-        API_RATE_LIMITS[api_name]['last_call'] = time.time()
+    wait_time = bucket.acquire()
+    if wait_time > 0:
+        logger.debug(f"Rate limiting {api_name}: waiting {wait_time:.1f}s")
+        time.sleep(wait_time)
 
 
+# Characters stripped from path components in one str.translate pass:
+# Windows-invalid < > : " / \ | ? * plus all ASCII control characters
+_DANGEROUS_PATH_CHARS = str.maketrans('', '', '<>:"/\\|?*' + ''.join(chr(i) for i in range(0x20)))
+
 def sanitize_path_component(name):
     """Sanitize a path component to prevent directory traversal and invalid chars.
 
@@ -695,12 +1084,21 @@ def sanitize_path_component(name):
         logger.warning(f"BLOCKED dangerous path component: {name}")
         return None
 
+    return _clean_path_component(name)
+
+
+@functools.lru_cache(maxsize=2048)
+def _clean_path_component(name):
+    """Character cleanup half of sanitize_path_component (cached).
+
+    The same authors and series come up for book after book in a scan, so
+    their cleaned form is remembered. The traversal check and its warning
+    stay in sanitize_path_component so every blocked attempt is still logged.
+    """
     # Remove/replace dangerous characters
     # Windows: < > : " / \ | ? *
     # Also remove control characters
-    dangerous_chars = '<>:"/\\|?*\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f'
-    for char in dangerous_chars:
-        name = name.replace(char, '')
+    name = name.translate(_DANGEROUS_PATH_CHARS)
 
     # Final strip and check
     name = name.strip('. ')  # Windows doesn't like trailing dots/spaces
@@ -710,6 +1108,52 @@ def sanitize_path_component(name):
     return name
 
 
+# Cleanup patterns for custom naming templates with missing optional fields.
+# Empty (), [] and {} go in one pass; the outer alternatives also swallow emptied
+# inner groups ("[()]", "{[ ]}") exactly as the old paren->bracket->brace passes did.
+_EMPTY_PAREN = r'\(\s*\)'
+_EMPTY_BRACKET = r'\[(?:\s|' + _EMPTY_PAREN + r')*\]'
+_EMPTY_BRACE = r'\{(?:\s|' + _EMPTY_PAREN + '|' + _EMPTY_BRACKET + r')*\}'
+_EMPTY_DELIMS_RE = re.compile('|'.join((_EMPTY_BRACE, _EMPTY_BRACKET, _EMPTY_PAREN)))
+_DANGLING_DASH_RE = re.compile(r'\s+-\s+(?=-|/|$)')
+_SLASH_LEADING_DASH_RE = re.compile(r'/-\s+')
+_START_DASH_RE = re.compile(r'^-\s+')
+_TRAILING_DASH_RE = re.compile(r'\s+-$')
+_MULTI_SLASH_SPACE_RE = re.compile(r'/{2,}|\s{2,}')
+
+
+# Tags understood in custom_naming_template; anything else stays literal
+_TEMPLATE_TAG_RE = re.compile(r'\{(author|title|series_num|series|narrator|year|edition|variant)\}')
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_naming_template(template):
+    """Split a custom template into alternating literal/tag pieces (cached per template)."""
+    return tuple(_TEMPLATE_TAG_RE.split(template))
+
+
+def _render_naming_template(template, values):
+    """Fill a custom template in one pass over its pre-parsed pieces."""
+    pieces = _parse_naming_template(template)
+    return ''.join(values[piece] if i % 2 else piece for i, piece in enumerate(pieces))
+
+
+def _collapse_slash_or_space(match):
+    return '/' if match.group(0)[0] == '/' else ' '
+
+
+def _tidy_custom_path(path_str):
+    """Clean up a filled-in custom template (empty brackets, stray dashes, doubled separators)."""
+    path_str = _EMPTY_DELIMS_RE.sub('', path_str)  # Empty (), [], {} (literal, not tags)
+    if '-' in path_str:
+        path_str = _DANGLING_DASH_RE.sub('', path_str)  # Dangling " - " before separator
+        path_str = _SLASH_LEADING_DASH_RE.sub('/', path_str)  # Leading "- " after slash (Issue #16)
+        path_str = _START_DASH_RE.sub('', path_str)  # Leading "- " at start
+        path_str = _TRAILING_DASH_RE.sub('', path_str)  # Trailing " -" at end
+    path_str = _MULTI_SLASH_SPACE_RE.sub(_collapse_slash_or_space, path_str)  # Multiple slashes/spaces
+    return path_str.strip(' /')
+
+
 def build_new_path(lib_path, author, title, series=None, series_num=None, narrator=None, year=None,
                    edition=None, variant=None, config=None):
     """Build a new path based on the naming format configuration.
@@ -781,28 +1225,19 @@ def build_new_path(lib_path, author, title, series=None, series_num=None, narrat
         safe_series_num = str(series_num) if series_num else ''
 
         # Build the path from template
-        path_str = custom_template
-        path_str = path_str.replace('{author}', safe_author)
-        path_str = path_str.replace('{title}', safe_title)
-        path_str = path_str.replace('{series}', safe_series or '')
-        path_str = path_str.replace('{series_num}', safe_series_num)
-        path_str = path_str.replace('{narrator}', safe_narrator)
-        path_str = path_str.replace('{year}', safe_year)
-        path_str = path_str.replace('{edition}', safe_edition)
-        path_str = path_str.replace('{variant}', safe_variant)
+        path_str = _render_naming_template(custom_template, {
+            'author': safe_author,
+            'title': safe_title,
+            'series': safe_series or '',
+            'series_num': safe_series_num,
+            'narrator': safe_narrator or '',
+            'year': safe_year,
+            'edition': safe_edition or '',
+            'variant': safe_variant or '',
+        })
 
         # Clean up empty brackets/parens from missing optional data
-        import re
-        path_str = re.sub(r'\(\s*\)', '', path_str)  # Empty ()
-        path_str = re.sub(r'\[\s*\]', '', path_str)  # Empty []
-        path_str = re.sub(r'\{\s*\}', '', path_str)  # Empty {} (literal, not tags)
-        path_str = re.sub(r'\s+-\s+(?=-|/|$)', '', path_str)  # Dangling " - " before separator
-        path_str = re.sub(r'/-\s+', '/', path_str)  # Leading "- " after slash (Issue #16)
-        path_str = re.sub(r'^-\s+', '', path_str)  # Leading "- " at start
-        path_str = re.sub(r'\s+-$', '', path_str)  # Trailing " -" at end
-        path_str = re.sub(r'/+', '/', path_str)  # Multiple slashes
-        path_str = re.sub(r'\s{2,}', ' ', path_str)  # Multiple spaces
-        path_str = path_str.strip(' /')
+        path_str = _tidy_custom_path(path_str)
 
         # Split by / to create path components
         parts = [p.strip() for p in path_str.split('/') if p.strip()]
@@ -846,36 +1281,107 @@ def build_new_path(lib_path, author, title, series=None, series_num=None, narrat
     return result_path
 
 
+# Search-title cleanup patterns (clean_search_title runs for every lookup)
+_BRACKETED_RE = re.compile(r'\[.*?\]')
+_PAREN_JUNK_RE = re.compile(r'\((?:Unabridged|Abridged|\d{4}|MP3|M4B|EPUB|PDF|64k|128k|r\d+\.\d+).*?\)', re.IGNORECASE)
+_FILE_EXT_RE = re.compile(r'\.(mp3|m4b|m4a|epub|pdf|mobi|webm|opus)$', re.IGNORECASE)
+_BY_AUTHOR_SUFFIX_RE = re.compile(r'\s+by\s+[\w\s]+$', re.IGNORECASE)
+# Audiobook/rip junk words, fused into two alternations (was four passes).
+# The split matters: deleting "complete" from "audio complete book" must still
+# let "audio ... book" match afterwards, so audio/book words run second.
+_EDITION_JUNK_RE = re.compile(r'\b(?:full\s+audiobook|audiobook|complete|unabridged|abridged)\b', re.IGNORECASE)
+_AUDIO_PROMO_JUNK_RE = re.compile(r'\b(?:audio\s*book|audio|free|download|hd|hq)\b', re.IGNORECASE)
+_TRAILING_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b\s*$')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=2048)
 def clean_search_title(messy_name):
-    """Clean up a messy filename to extract searchable title."""
-    import re
+    """Clean up a messy filename to extract searchable title (cached per name)."""
     # Remove common junk patterns
     clean = messy_name
     # Remove bracketed content like [bitsearch.to], [64k], [r1.1]
-    clean = re.sub(r'\[.*?\]', '', clean)
+    clean = _BRACKETED_RE.sub('', clean)
     # Remove parenthetical junk like (Unabridged), (2019)
-    clean = re.sub(r'\((?:Unabridged|Abridged|\d{4}|MP3|M4B|EPUB|PDF|64k|128k|r\d+\.\d+).*?\)', '', clean, flags=re.IGNORECASE)
+    clean = _PAREN_JUNK_RE.sub('', clean)
     # Remove file extensions
-    clean = re.sub(r'\.(mp3|m4b|m4a|epub|pdf|mobi|webm|opus)$', '', clean, flags=re.IGNORECASE)
+    clean = _FILE_EXT_RE.sub('', clean)
     # Remove "by Author" at the end temporarily for searching
-    clean = re.sub(r'\s+by\s+[\w\s]+$', '', clean, flags=re.IGNORECASE)
+    clean = _BY_AUTHOR_SUFFIX_RE.sub('', clean)
     # Remove audiobook-related junk (YouTube rip artifacts)
-    clean = re.sub(r'\b(full\s+)?audiobook\b', '', clean, flags=re.IGNORECASE)
-    clean = re.sub(r'\b(complete|unabridged|abridged)\b', '', clean, flags=re.IGNORECASE)
-    clean = re.sub(r'\b(audio\s*book|audio)\b', '', clean, flags=re.IGNORECASE)
-    clean = re.sub(r'\b(free|download|hd|hq)\b', '', clean, flags=re.IGNORECASE)
+    clean = _EDITION_JUNK_RE.sub('', clean)
+    clean = _AUDIO_PROMO_JUNK_RE.sub('', clean)
     # Remove years at the end like "2020" or "2019"
-    clean = re.sub(r'\b(19|20)\d{2}\b\s*$', '', clean)
+    clean = _TRAILING_YEAR_RE.sub('', clean)
     # Remove extra whitespace
-    clean = re.sub(r'\s+', ' ', clean)
+    clean = _WHITESPACE_RE.sub(' ', clean)
     # Remove leading/trailing junk
     clean = clean.strip(' -_.')
     return clean
 
 
+# How long a successful metadata search result is reused (rescans, re-verification)
+API_CACHE_TTL = 7 * 24 * 3600
+# Misses are only remembered in memory, briefly: long enough that the lookup and
+# the verification pass for the same book don't repeat them, short enough that
+# a timeout or outage doesn't hide a book.
+API_MISS_TTL = 600
+_api_miss_cache = {}  # key -> time.monotonic() expiry
+_api_miss_lock = threading.Lock()
+
+
+def cached_api_search(provider):
+    """Decorator: cache a search_* function's successful results in library.db.
+
+    Keyed by provider + lowercased title/author. Only hits are stored - the
+    search functions return None for both "no match" and "request failed",
+    and a timeout must not hide a book for days (misses get API_MISS_TTL in
+    memory instead). A cache hit also skips the provider's rate-limit wait,
+    since no request is made.
+    """
+    def decorator(search_func):
+        @functools.wraps(search_func)
+        def wrapper(title, author=None, *args, **kwargs):
+            key = f"{provider}|{(title or '').lower()}|{(author or '').lower()}"
+            if _api_miss_cache.get(key, 0) > time.monotonic():
+                return None
+            try:
+                conn = get_db()
+                try:
+                    row = conn.execute('SELECT value FROM api_cache WHERE key = ? AND expires_at > ?',
+                                       (key, time.time())).fetchone()
+                finally:
+                    conn.close()
+                if row:
+                    return loads_json(row['value'])
+            except Exception as e:
+                logger.debug(f"API cache read failed: {e}")
+
+            result = search_func(title, author, *args, **kwargs)
+            if result:
+                try:
+                    conn = get_db()
+                    try:
+                        with conn:
+                            conn.execute('INSERT OR REPLACE INTO api_cache (key, value, expires_at) VALUES (?, ?, ?)',
+                                         (key, json.dumps(result), time.time() + API_CACHE_TTL))
+                    finally:
+                        conn.close()
+                except Exception as e:
+                    logger.debug(f"API cache write failed: {e}")
+            else:
+                with _api_miss_lock:
+                    if len(_api_miss_cache) > 4096:
+                        _api_miss_cache.clear()
+                    _api_miss_cache[key] = time.monotonic() + API_MISS_TTL
+            return result
+        return wrapper
+    return decorator
+
+
 # BookDB API endpoint (our private metadata service)
 BOOKDB_API_URL = "https://bookdb.deucebucket.com"
 
+@cached_api_search('bookdb')
 def search_bookdb(title, author=None, api_key=None):
     """
     Search our private BookDB metadata service.
@@ -889,7 +1395,7 @@ def search_bookdb(title, author=None, api_key=None):
         # Build the filename to match - include author if we have it
         filename = f"{author} - {title}" if author else title
 
-        resp = requests.post(
+        resp = _HTTP.post(
             f"{BOOKDB_API_URL}/match",
             json={"filename": filename},
             headers={"X-API-Key": api_key},
@@ -900,7 +1406,7 @@ def search_bookdb(title, author=None, api_key=None):
             logger.debug(f"BookDB returned status {resp.status_code}")
             return None
 
-        data = resp.json()
+        data = response_json(resp)
 
         # Check confidence threshold
         if data.get('confidence', 0) < 0.5:
@@ -951,21 +1457,20 @@ def search_bookdb(title, author=None, api_key=None):
         return None
 
 
+@cached_api_search('openlibrary')
 def search_openlibrary(title, author=None):
     """Search OpenLibrary for book metadata. Free, no API key needed."""
     rate_limit_wait('openlibrary')
     try:
-        import urllib.parse
-        query = urllib.parse.quote(title)
-        url = f"https://openlibrary.org/search.json?title={query}&limit=5"
+        params = {'title': title, 'limit': 5}
         if author:
-            url += f"&author={urllib.parse.quote(author)}"
+            params['author'] = author
 
-        resp = requests.get(url, timeout=10)
+        resp = _HTTP.get('https://openlibrary.org/search.json', params=params, timeout=10)
         if resp.status_code != 200:
             return None
 
-        data = resp.json()
+        data = response_json(resp)
         docs = data.get('docs', [])
 
         if not docs:
@@ -989,24 +1494,50 @@ def search_openlibrary(title, author=None):
         logger.debug(f"OpenLibrary search failed: {e}")
         return None
 
+# Series hints in Google Books subtitles
+_SUBTITLE_NOVEL_RE = re.compile(r'^A\s+(.+?)\s+Novel$', re.IGNORECASE)
+_SUBTITLE_BOOK_OF_RE = re.compile(r'Book\s+(\d+)\s+of\s+(.+)', re.IGNORECASE)
+_SUBTITLE_SERIES_NUM_RE = re.compile(r'(.+?)\s+(?:Book|#)\s*(\d+)', re.IGNORECASE)
+
+
+def _series_from_subtitle(subtitle):
+    """Pull (series_name, series_num) out of a Google Books subtitle.
+
+    Later patterns used to overwrite earlier matches, so they are tried
+    most-specific-wins first and the first hit returns.
+    """
+    # "The Expanse Book 2" or "Mistborn #1"
+    match = _SUBTITLE_SERIES_NUM_RE.search(subtitle)
+    if match:
+        return match.group(1), int(match.group(2))
+    # "Book 2 of The Expanse" -> The Expanse, 2
+    match = _SUBTITLE_BOOK_OF_RE.search(subtitle)
+    if match:
+        return match.group(2), int(match.group(1))
+    # "A Mistborn Novel" -> Mistborn
+    match = _SUBTITLE_NOVEL_RE.search(subtitle)
+    if match:
+        return match.group(1), None
+    return None, None
+
+@cached_api_search('googlebooks')
 def search_google_books(title, author=None, api_key=None):
     """Search Google Books for book metadata."""
     rate_limit_wait('googlebooks')
     try:
-        import urllib.parse
         query = title
         if author:
             query += f" inauthor:{author}"
 
-        url = f"https://www.googleapis.com/books/v1/volumes?q={urllib.parse.quote(query)}&maxResults=5"
+        params = {'q': query, 'maxResults': 5}
         if api_key:
-            url += f"&key={api_key}"
+            params['key'] = api_key
 
-        resp = requests.get(url, timeout=10)
+        resp = _HTTP.get('https://www.googleapis.com/books/v1/volumes', params=params, timeout=10)
         if resp.status_code != 200:
             return None
 
-        data = resp.json()
+        data = response_json(resp)
         items = data.get('items', [])
 
         if not items:
@@ -1021,20 +1552,7 @@ def search_google_books(title, author=None, api_key=None):
         series_num = None
         subtitle = best.get('subtitle', '')
         if subtitle:
-            # "A Mistborn Novel" -> Mistborn
-            match = re.search(r'^A\s+(.+?)\s+Novel$', subtitle, re.IGNORECASE)
-            if match:
-                series_name = match.group(1)
-            # "Book 2 of The Expanse" -> The Expanse, 2
-            match = re.search(r'Book\s+(\d+)\s+of\s+(.+)', subtitle, re.IGNORECASE)
-            if match:
-                series_num = int(match.group(1))
-                series_name = match.group(2)
-            # "The Expanse Book 2" or "Mistborn #1"
-            match = re.search(r'(.+?)\s+(?:Book|#)\s*(\d+)', subtitle, re.IGNORECASE)
-            if match:
-                series_name = match.group(1)
-                series_num = int(match.group(2))
+            series_name, series_num = _series_from_subtitle(subtitle)
 
         result = {
             'title': best.get('title', ''),
@@ -1054,23 +1572,21 @@ def search_google_books(title, author=None, api_key=None):
         logger.debug(f"Google Books search failed: {e}")
         return None
 
+@cached_api_search('audnexus')
 def search_audnexus(title, author=None):
     """Search Audnexus API for audiobook metadata. Pulls from Audible."""
     rate_limit_wait('audnexus')
     try:
-        import urllib.parse
         # Audnexus search endpoint
         query = title
         if author:
             query = f"{title} {author}"
 
-        url = f"https://api.audnex.us/books?title={urllib.parse.quote(query)}"
-
-        resp = requests.get(url, timeout=10, headers={'Accept': 'application/json'})
+        resp = _HTTP.get('https://api.audnex.us/books', params={'title': query}, timeout=10)
         if resp.status_code != 200:
             return None
 
-        data = resp.json()
+        data = response_json(resp)
         if not data or not isinstance(data, list) or len(data) == 0:
             return None
 
@@ -1092,35 +1608,33 @@ def search_audnexus(title, author=None):
         logger.debug(f"Audnexus search failed: {e}")
         return None
 
+# Hardcover search query, whitespace-collapsed once so each request body stays small
+_HARDCOVER_SEARCH_QUERY = " ".join("""
+    query SearchBooks($query: String!) {
+        search(query: $query, limit: 5) {
+            books {
+                title
+                contributions { author { name } }
+                releaseYear
+            }
+        }
+    }
+""".split())
+
+@cached_api_search('hardcover')
 def search_hardcover(title, author=None):
     """Search Hardcover.app API for book metadata."""
     rate_limit_wait('hardcover')
     try:
-        import urllib.parse
         # Hardcover GraphQL API
         query = title
         if author:
             query = f"{title} {author}"
 
         # Hardcover uses GraphQL
-        graphql_query = {
-            "query": """
-                query SearchBooks($query: String!) {
-                    search(query: $query, limit: 5) {
-                        books {
-                            title
-                            contributions { author { name } }
-                            releaseYear
-                        }
-                    }
-                }
-            """,
-            "variables": {"query": query}
-        }
-
-        resp = requests.post(
+        resp = _HTTP.post(
             "https://api.hardcover.app/v1/graphql",
-            json=graphql_query,
+            json={"query": _HARDCOVER_SEARCH_QUERY, "variables": {"query": query}},
             headers={'Content-Type': 'application/json'},
             timeout=10
         )
@@ -1128,7 +1642,7 @@ def search_hardcover(title, author=None):
         if resp.status_code != 200:
             return None
 
-        data = resp.json()
+        data = response_json(resp)
         books = data.get('data', {}).get('search', {}).get('books', [])
 
         if not books:
@@ -1153,10 +1667,12 @@ def search_hardcover(title, author=None):
         logger.debug(f"Hardcover search failed: {e}")
         return None
 
+# "Author" halves that are really titles/volumes (years, book/vol/part, [tags])
+_AUTHOR_JUNK_RE = re.compile(r'\d{4}|book|vol|part|\[', re.I)
+
+@functools.lru_cache(maxsize=4096)
 def extract_author_title(messy_name):
     """Try to extract author and title from a folder name like 'Author - Title' or 'Author/Title'."""
-    import re
-
     # Common separators: " - ", " / ", " _ "
     separators = [' - ', ' / ', ' _ ', ' – ']  # includes en-dash
 
@@ -1167,7 +1683,7 @@ def extract_author_title(messy_name):
                 author = parts[0].strip()
                 title = parts[1].strip()
                 # Basic validation - author shouldn't be too long or look like a title
-                if len(author) < 50 and not re.search(r'\d{4}|book|vol|part|\[', author, re.I):
+                if len(author) < 50 and not _AUTHOR_JUNK_RE.search(author):
                     return author, title
 
     # No separator found - just return the whole thing as title
@@ -1197,6 +1713,11 @@ def lookup_book_metadata(messy_name, config, folder_path=None):
                 if len(clean_title) < 5 or clean_title.lower().startswith('chapter'):
                     clean_title = folder_hints['audio_title']
 
+    # Don't spend a call on every API for "Chapter 19", "intro", "track05"...
+    if is_unsearchable_query(clean_title):
+        logger.debug(f"Skipping lookup for unsearchable title: {clean_title}")
+        return None
+
     if author_hint:
         logger.debug(f"Looking up metadata for: '{clean_title}' by '{author_hint}'")
     else:
@@ -1212,60 +1733,81 @@ def lookup_book_metadata(messy_name, config, folder_path=None):
             return None
         return result
 
+    # Sources in priority order - the first valid result wins
+    searches = []
     # 0. Try BookDB first (our private metadata service with fuzzy matching)
     bookdb_key = config.get('bookdb_api_key')
     if bookdb_key:
-        result = validate_result(search_bookdb(clean_title, author=author_hint, api_key=bookdb_key), clean_title)
-        if result:
-            return result
-
+        searches.append(lambda: search_bookdb(clean_title, author=author_hint, api_key=bookdb_key))
     # 1. Try Audnexus (best for audiobooks, pulls from Audible)
-    result = validate_result(search_audnexus(clean_title, author=author_hint), clean_title)
-    if result:
-        return result
-
+    searches.append(lambda: search_audnexus(clean_title, author=author_hint))
     # 2. Try OpenLibrary (free, huge database)
-    result = validate_result(search_openlibrary(clean_title, author=author_hint), clean_title)
-    if result:
-        return result
-
+    searches.append(lambda: search_openlibrary(clean_title, author=author_hint))
     # 3. Try Google Books
     google_key = config.get('google_books_api_key')
-    result = validate_result(search_google_books(clean_title, author=author_hint, api_key=google_key), clean_title)
-    if result:
-        return result
-
+    searches.append(lambda: search_google_books(clean_title, author=author_hint, api_key=google_key))
     # 4. Try Hardcover.app (modern Goodreads alternative)
-    result = validate_result(search_hardcover(clean_title, author=author_hint), clean_title)
-    if result:
-        return result
+    searches.append(lambda: search_hardcover(clean_title, author=author_hint))
+
+    if config.get('parallel_lookup', False):
+        # Query every source at once, then take results in priority order.
+        # Costs a call per source on every lookup, so it's opt-in.
+        pool = ThreadPoolExecutor(max_workers=len(searches))
+        try:
+            futures = [pool.submit(search) for search in searches]
+            for future in futures:
+                result = validate_result(future.result(), clean_title)
+                if result:
+                    return result
+        finally:
+            # Don't wait on lower-priority calls still in flight
+            pool.shutdown(wait=False)
+    else:
+        for search in searches:
+            result = validate_result(search(), clean_title)
+            if result:
+                return result
 
     logger.debug(f"No valid API results for: {clean_title}")
     return None
 
 
-def gather_all_api_candidates(title, author=None, config=None):
+def _candidate_key(candidate):
+    """Identity of an API candidate for de-duplication: lowercased (author, title)."""
+    return ((candidate.get('author') or '').lower(), (candidate.get('title') or '').lower())
+
+
+def make_api_dispatch(config):
+    """(name, search(title, author)) for every metadata API, with API keys bound from config."""
+    return [
+        ('BookDB', functools.partial(search_bookdb, api_key=config.get('bookdb_api_key') if config else None)),
+        ('Audnexus', search_audnexus),
+        ('OpenLibrary', search_openlibrary),
+        ('GoogleBooks', functools.partial(search_google_books, api_key=config.get('google_books_api_key') if config else None)),
+        ('Hardcover', search_hardcover),
+    ]
+
+
+def gather_all_api_candidates(title, author=None, config=None, apis=None):
     """
     Search ALL APIs and return ALL results (not just the first match).
     This is used for verification when we need multiple perspectives.
     Now with garbage match filtering.
+
+    apis: optional make_api_dispatch() list, so repeated calls can share one.
     """
     candidates = []
     clean_title = clean_search_title(title)
 
-    if not clean_title or len(clean_title) < 3:
+    if not clean_title or len(clean_title) < 3 or is_unsearchable_query(clean_title):
         return candidates
 
     # Search each API and collect all results
-    apis = [
-        ('BookDB', lambda t, a: search_bookdb(t, a, config.get('bookdb_api_key') if config else None)),
-        ('Audnexus', search_audnexus),
-        ('OpenLibrary', search_openlibrary),
-        ('GoogleBooks', lambda t, a: search_google_books(t, a, config.get('google_books_api_key') if config else None)),
-        ('Hardcover', search_hardcover),
-    ]
+    if apis is None:
+        apis = make_api_dispatch(config)
 
-    for api_name, search_func in apis:
+    def search_api(api_name, search_func):
+        found = []
         try:
             # Search with author hint
             result = search_func(clean_title, author)
@@ -1276,7 +1818,7 @@ def gather_all_api_candidates(title, author=None, config=None):
                     logger.debug(f"REJECTED garbage from {api_name}: '{clean_title}' -> '{suggested_title}'")
                 else:
                     result['search_query'] = f"{author} - {clean_title}" if author else clean_title
-                    candidates.append(result)
+                    found.append(result)
 
             # Also search without author (might find different results)
             if author:
@@ -1287,15 +1829,22 @@ def gather_all_api_candidates(title, author=None, config=None):
                         logger.debug(f"REJECTED garbage from {api_name}: '{clean_title}' -> '{suggested_title}'")
                     elif result_no_author.get('author') != (result.get('author') if result else None):
                         result_no_author['search_query'] = clean_title
-                        candidates.append(result_no_author)
+                        found.append(result_no_author)
         except Exception as e:
             logger.debug(f"Error searching {api_name}: {e}")
+        return found
+
+    # Every API is queried anyway, so query them side by side (each API's own
+    # calls stay sequential and rate limited); candidates keep API order
+    with ThreadPoolExecutor(max_workers=len(apis)) as pool:
+        for found in pool.map(lambda api: search_api(*api), apis):
+            candidates.extend(found)
 
     # Deduplicate by author+title
     seen = set()
     unique_candidates = []
     for c in candidates:
-        key = f"{c.get('author', '').lower()}|{c.get('title', '').lower()}"
+        key = _candidate_key(c)
         if key not in seen:
             seen.add(key)
             unique_candidates.append(c)
@@ -1307,9 +1856,10 @@ def build_verification_prompt(original_input, original_author, original_title, p
     """
     Build a verification prompt that shows ALL API candidates and asks AI to vote.
     """
-    candidate_list = ""
-    for i, c in enumerate(candidates, 1):
-        candidate_list += f"  CANDIDATE_{i}: {c.get('author', 'Unknown')} - {c.get('title', 'Unknown')} (from {c.get('source', 'Unknown')})\n"
+    candidate_list = "".join(
+        f"  CANDIDATE_{i}: {c.get('author', 'Unknown')} - {c.get('title', 'Unknown')} (from {c.get('source', 'Unknown')})\n"
+        for i, c in enumerate(candidates, 1)
+    )
 
     if not candidate_list:
         candidate_list = "  No API results found.\n"
@@ -1379,13 +1929,18 @@ def verify_drastic_change(original_input, original_author, original_title, propo
     logger.info(f"Verifying drastic change: {original_author} -> {proposed_author}")
 
     # Gather ALL candidates from ALL APIs
-    candidates = gather_all_api_candidates(original_title, original_author, config)
+    apis = make_api_dispatch(config)
+    candidates = gather_all_api_candidates(original_title, original_author, config, apis)
 
     # Also search with proposed info to get more candidates
     if proposed_author and proposed_author != original_author:
-        more_candidates = gather_all_api_candidates(proposed_title, proposed_author, config)
+        more_candidates = gather_all_api_candidates(proposed_title, proposed_author, config, apis)
+        # Same author+title key gather_all_api_candidates dedupes on
+        seen = {_candidate_key(c) for c in candidates}
         for c in more_candidates:
-            if c not in candidates:
+            key = _candidate_key(c)
+            if key not in seen:
+                seen.add(key)
                 candidates.append(c)
 
     logger.info(f"Gathered {len(candidates)} candidates for verification")
@@ -1547,20 +2102,51 @@ def parse_json_response(text):
         text = text[3:]
     if text.endswith("```"):
         text = text[:-3]
-    return json.loads(text.strip())
+    return loads_json(text.strip())
+
+# Most names sent to the AI in one prompt; bigger batches are split into
+# chunks of this size and the chunks are sent in parallel
+AI_CHUNK_SIZE = 20
+AI_CHUNK_WORKERS = 4
 
 def call_ai(messy_names, config):
     """Call AI API to parse book names, with API lookups for context."""
-    # First, try to look up each book in metadata APIs
+    # First, try to look up each book in metadata APIs. Names are looked up
+    # concurrently; rate_limit_wait still spaces out calls to each provider.
     api_results = []
-    for name in messy_names:
-        result = lookup_book_metadata(name, config)
-        api_results.append(result)
+    if messy_names:
+        with ThreadPoolExecutor(max_workers=min(8, len(messy_names))) as pool:
+            api_results = list(pool.map(lambda name: lookup_book_metadata(name, config), messy_names))
+    for name, result in zip(messy_names, api_results):
         if result:
             logger.info(f"API lookup success for: {name[:50]}...")
 
-    # Build prompt with API results included
-    prompt = build_prompt(messy_names, api_results)
+    if len(messy_names) <= AI_CHUNK_SIZE:
+        # Build prompt with API results included
+        return call_ai_prompt(build_prompt(messy_names, api_results), config)
+
+    # Large batch: one prompt per chunk (ITEM_N numbering restarts per chunk)
+    starts = range(0, len(messy_names), AI_CHUNK_SIZE)
+    prompts = [build_prompt(messy_names[i:i + AI_CHUNK_SIZE], api_results[i:i + AI_CHUNK_SIZE])
+               for i in starts]
+    with ThreadPoolExecutor(max_workers=min(AI_CHUNK_WORKERS, len(prompts))) as pool:
+        chunk_results = list(pool.map(lambda prompt: call_ai_prompt(prompt, config), prompts))
+
+    # Callers pair results with names by position, so stop at the first chunk
+    # that failed or came back short - the rest stay queued for the next batch
+    results = []
+    for start, chunk in zip(starts, chunk_results):
+        expected = min(AI_CHUNK_SIZE, len(messy_names) - start)
+        if not isinstance(chunk, list):
+            break
+        results.extend(chunk[:expected])
+        if len(chunk) < expected:
+            break
+    return results or None
+
+
+def call_ai_prompt(prompt, config):
+    """Send a prompt to the configured AI provider and return the parsed JSON."""
     provider = config.get('ai_provider', 'openrouter')
 
     # Use selected provider
@@ -1608,7 +2194,7 @@ def call_openrouter(prompt, config):
         )
 
         if resp.status_code == 200:
-            result = resp.json()
+            result = response_json(resp)
             text = result.get("choices", [{}])[0].get("message", {}).get("content", "")
             if text:
                 return parse_json_response(text)
@@ -1631,65 +2217,65 @@ def call_openrouter(prompt, config):
     return None
 
 
+# Gemini 429 messages say "Please retry in X.XXXs"
+_RETRY_IN_RE = re.compile(r'retry in (\d+\.?\d*)s')
+
 def call_gemini(prompt, config, retry_count=0):
-    """Call Google Gemini API directly with automatic retry on rate limit."""
-    try:
-        api_key = config.get('gemini_api_key')
-        model = config.get('gemini_model', 'gemini-2.0-flash')
+    """Call Google Gemini API directly with automatic retry on rate limit (up to 3 retries)."""
+    api_key = config.get('gemini_api_key')
+    model = config.get('gemini_model', 'gemini-2.0-flash')
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
+    headers = {"Content-Type": "application/json"}
+    payload = {
+        "contents": [{"parts": [{"text": prompt}]}],
+        "generationConfig": {"temperature": 0.1}
+    }
 
-        resp = requests.post(
-            f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}",
-            headers={"Content-Type": "application/json"},
-            json={
-                "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {"temperature": 0.1}
-            },
-            timeout=90
-        )
+    for attempt in range(retry_count, 4):
+        try:
+            resp = requests.post(url, headers=headers, json=payload, timeout=90)
+
+            if resp.status_code == 200:
+                result = response_json(resp)
+                text = result.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
+                if text:
+                    return parse_json_response(text)
+                return None
 
-        if resp.status_code == 200:
-            result = resp.json()
-            text = result.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
-            if text:
-                return parse_json_response(text)
-        elif resp.status_code == 429 and retry_count < 3:
-            # Rate limit - parse retry time and wait
             error_msg = explain_http_error(resp.status_code, "Gemini")
             logger.warning(f"Gemini: {error_msg}")
+            wait_time = None
             try:
                 detail = resp.json().get('error', {}).get('message', '')
                 if detail:
                     logger.warning(f"Gemini detail: {detail}")
                     # Try to parse "Please retry in X.XXXs" from message
-                    import re
-                    match = re.search(r'retry in (\d+\.?\d*)s', detail)
+                    match = _RETRY_IN_RE.search(detail)
                     if match:
                         wait_time = float(match.group(1)) + 5  # Add 5 sec buffer
-                        logger.info(f"Gemini: Waiting {wait_time:.0f} seconds before retry...")
-                        time.sleep(wait_time)
-                        return call_gemini(prompt, config, retry_count + 1)
             except:
                 pass
-            # Default wait if we can't parse the time
-            wait_time = 45 * (retry_count + 1)
-            logger.info(f"Gemini: Waiting {wait_time} seconds before retry...")
+
+            if resp.status_code != 429 or attempt >= 3:
+                return None
+
+            # Rate limit - wait and retry
+            if wait_time is not None:
+                logger.info(f"Gemini: Waiting {wait_time:.0f} seconds before retry...")
+            else:
+                # Default wait if we can't parse the time
+                wait_time = 45 * (attempt + 1)
+                logger.info(f"Gemini: Waiting {wait_time} seconds before retry...")
             time.sleep(wait_time)
-            return call_gemini(prompt, config, retry_count + 1)
-        else:
-            error_msg = explain_http_error(resp.status_code, "Gemini")
-            logger.warning(f"Gemini: {error_msg}")
-            try:
-                detail = resp.json().get('error', {}).get('message', '')
-                if detail:
-                    logger.warning(f"Gemini detail: {detail}")
-            except:
-                pass
-    except requests.exceptions.Timeout:
-        logger.error("Gemini: Request timed out after 90 seconds")
-    except requests.exceptions.ConnectionError:
-        logger.error("Gemini: Connection failed - check your internet")
-    except Exception as e:
-        logger.error(f"Gemini: {e}")
+        except requests.exceptions.Timeout:
+            logger.error("Gemini: Request timed out after 90 seconds")
+            return None
+        except requests.exceptions.ConnectionError:
+            logger.error("Gemini: Connection failed - check your internet")
+            return None
+        except Exception as e:
+            logger.error(f"Gemini: {e}")
+            return None
     return None
 
 
@@ -1803,7 +2389,7 @@ Only include information you actually heard - do not guess."""
         )
 
         if resp.status_code == 200:
-            result = resp.json()
+            result = response_json(resp)
             text = result.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
             if text:
                 parsed = parse_json_response(text)
@@ -1877,8 +2463,24 @@ import re
 import hashlib
 
 # Audio file extensions we care about
-AUDIO_EXTENSIONS = {'.m4b', '.mp3', '.m4a', '.flac', '.ogg', '.opus', '.wma', '.aac'}
-EBOOK_EXTENSIONS = {'.epub', '.pdf', '.mobi', '.azw3'}
+AUDIO_EXTENSIONS = frozenset({'.m4b', '.mp3', '.m4a', '.flac', '.ogg', '.opus', '.wma', '.aac'})
+EBOOK_EXTENSIONS = frozenset({'.epub', '.pdf', '.mobi', '.azw3'})
+_AUDIO_EXT_NODOT = frozenset(e.lstrip('.') for e in AUDIO_EXTENSIONS)
+
+
+def is_audio_filename(name):
+    """Same answer as Path(name).suffix.lower() in AUDIO_EXTENSIONS, without building a Path."""
+    stem, _, ext = name.rpartition('.')
+    return bool(stem) and ext.lower() in _AUDIO_EXT_NODOT
+
+
+_EBOOK_EXT_NODOT = frozenset(e.lstrip('.') for e in EBOOK_EXTENSIONS)
+
+
+def is_ebook_filename(name):
+    """Same answer as Path(name).suffix.lower() in EBOOK_EXTENSIONS, without building a Path."""
+    stem, _, ext = name.rpartition('.')
+    return bool(stem) and ext.lower() in _EBOOK_EXT_NODOT
 
 # Patterns for disc/chapter folders (these are NOT book titles)
 DISC_CHAPTER_PATTERNS = [
@@ -1916,38 +2518,42 @@ AUTHOR_IN_TITLE_PATTERNS = [
     r'\s+-\s+([A-Z][a-z]+\s+[A-Z][a-z]+)\s*$',  # "Title - Author Name"
 ]
 
+def _any_of(patterns, flags=0):
+    """Compile a list of patterns into one alternation, so "does any match" is a single scan."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+
+# Compiled once - these run against every folder during a deep scan
+_DISC_CHAPTER_RE = _any_of(DISC_CHAPTER_PATTERNS, re.IGNORECASE)
+_JUNK_RES = [(p, re.compile(p, re.IGNORECASE)) for p in JUNK_PATTERNS]
+# One alternation over every junk pattern: a single scan tells clean_title
+# whether the (rare) per-pattern pass is needed at all
+_JUNK_ANY_RE = _any_of(JUNK_PATTERNS, re.IGNORECASE)
+# Every JUNK_PATTERNS entry needs one of these characters to match (the K's
+# cover IGNORECASE's k/K/Kelvin sign), so most clean titles skip the regex.
+# Keep this in sync when adding junk patterns.
+_JUNK_TRIGGER_CHARS = frozenset('[({.kK\u212a')
+
 
 # ============== ORPHAN FILE HANDLING ==============
 
 def read_audio_metadata(file_path):
     """Read ID3/metadata tags from an audio file to identify the book."""
+    if MutagenFile is None:
+        return None
     try:
-        from mutagen import File
-        from mutagen.easyid3 import EasyID3
-        from mutagen.mp3 import MP3
-        from mutagen.mp4 import MP4
-
-        audio = File(file_path, easy=True)
+        audio = MutagenFile(file_path, easy=True)
         if audio is None:
             return None
 
         metadata = {}
 
-        # Try to get album (usually the book title for audiobooks)
-        if 'album' in audio:
-            metadata['album'] = audio['album'][0] if isinstance(audio['album'], list) else audio['album']
-
-        # Try to get artist (sometimes narrator, sometimes author)
-        if 'artist' in audio:
-            metadata['artist'] = audio['artist'][0] if isinstance(audio['artist'], list) else audio['artist']
-
-        # Try to get album artist (often the author)
-        if 'albumartist' in audio:
-            metadata['albumartist'] = audio['albumartist'][0] if isinstance(audio['albumartist'], list) else audio['albumartist']
-
-        # Try to get title (track title)
-        if 'title' in audio:
-            metadata['title'] = audio['title'][0] if isinstance(audio['title'], list) else audio['title']
+        # album: usually the book title; artist: sometimes narrator, sometimes author;
+        # albumartist: often the author; title: the track title
+        for key in ('album', 'artist', 'albumartist', 'title'):
+            if key in audio:
+                value = audio[key]
+                metadata[key] = value[0] if isinstance(value, list) else value
 
         return metadata if metadata else None
     except Exception as e:
@@ -1955,58 +2561,128 @@ def read_audio_metadata(file_path):
         return None
 
 
+# Filename fallbacks for orphan grouping: "01 - Title", "Title 01", "Title - Chapter 3"
+_LEADING_TRACK_NUM_RE = re.compile(r'^\d+[\s\-\.]+')
+_TRAILING_TRACK_NUM_RE = re.compile(r'[\s\-]+\d+$')
+_CHAPTER_SUFFIX_RE = re.compile(r'\s*-\s*(chapter|part|track|disc)\s*\d*.*$', re.IGNORECASE)
+
+
+ORPHAN_METADATA_WORKERS = 8  # Concurrent tag reads while grouping orphan files
+
+
 def find_orphan_audio_files(lib_path):
     """Find audio files sitting directly in author folders (not in book subfolders)."""
     orphans = []
 
-    for author_dir in Path(lib_path).iterdir():
-        if not author_dir.is_dir():
-            continue
-
-        author = author_dir.name
+    with ThreadPoolExecutor(max_workers=ORPHAN_METADATA_WORKERS) as pool, os.scandir(lib_path) as author_entries:
+        for author_entry in author_entries:
+            # DirEntry type checks use the d_type from readdir - no stat per entry on Linux
+            if not author_entry.is_dir():
+                continue
 
-        # Find audio files directly in author folder
-        direct_audio = [f for f in author_dir.iterdir()
-                       if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS]
+            author = author_entry.name
+            author_dir = author_entry.path
 
-        if direct_audio:
-            # Group files by potential book (using metadata or filename patterns)
-            books = {}
+            # Find audio files directly in author folder. Tag reads are disk-bound,
+            # so each one is started as soon as its file is seen and runs while
+            # the rest of the folder is listed.
+            with os.scandir(author_dir) as entries:
+                direct_audio = [(Path(entry.path), pool.submit(read_audio_metadata, entry.path))
+                                for entry in entries
+                                if is_audio_filename(entry.name) and entry.is_file()]
 
-            for audio_file in direct_audio:
-                # Try to read metadata
-                metadata = read_audio_metadata(str(audio_file))
+            if direct_audio:
+                # Group files by potential book (using metadata or filename patterns)
+                books = {}
 
-                if metadata and metadata.get('album'):
-                    book_title = metadata['album']
-                else:
-                    # Fallback: try to extract from filename
-                    # Pattern: "Book Title - Chapter 01.mp3" or "01 - Chapter Name.mp3"
-                    fname = audio_file.stem
-                    # Remove chapter/track numbers
-                    book_title = re.sub(r'^\d+[\s\-\.]+', '', fname)
-                    book_title = re.sub(r'[\s\-]+\d+$', '', book_title)
-                    book_title = re.sub(r'\s*-\s*(chapter|part|track|disc)\s*\d*.*$', '', book_title, flags=re.IGNORECASE)
-
-                    if not book_title or book_title == fname:
-                        book_title = "Unknown Album"
-
-                if book_title not in books:
-                    books[book_title] = []
-                books[book_title].append(audio_file)
-
-            for book_title, files in books.items():
-                orphans.append({
-                    'author': author,
-                    'author_path': str(author_dir),
-                    'detected_title': book_title,
-                    'files': [str(f) for f in files],
-                    'file_count': len(files)
-                })
+                for audio_file, pending_metadata in direct_audio:
+                    metadata = pending_metadata.result()
+                    if metadata and metadata.get('album'):
+                        book_title = metadata['album']
+                    else:
+                        # Fallback: try to extract from filename
+                        # Pattern: "Book Title - Chapter 01.mp3" or "01 - Chapter Name.mp3"
+                        fname = audio_file.stem
+                        # Remove chapter/track numbers
+                        book_title = _LEADING_TRACK_NUM_RE.sub('', fname)
+                        book_title = _TRAILING_TRACK_NUM_RE.sub('', book_title)
+                        book_title = _CHAPTER_SUFFIX_RE.sub('', book_title)
+
+                        if not book_title or book_title == fname:
+                            book_title = "Unknown Album"
+
+                    if book_title not in books:
+                        books[book_title] = []
+                    books[book_title].append(audio_file)
+
+                for book_title, files in books.items():
+                    orphans.append({
+                        'author': author,
+                        'author_path': author_dir,
+                        'detected_title': book_title,
+                        'files': [str(f) for f in files],
+                        'file_count': len(files)
+                    })
 
     return orphans
 
 
+# Orphan scan cache: {lib_path: (signature, orphans, cached_at)}
+# The scan reads tags from every loose audio file, so repeat visits to the
+# orphans page reuse the last result while the library folders are unchanged.
+ORPHAN_CACHE_TTL = 60  # Seconds
+_orphan_cache = {}
+_orphan_cache_lock = threading.Lock()
+
+
+def _orphan_scan_signature(lib_path):
+    """Cheap change detector: mtimes of the library root and each author folder.
+
+    Adding/removing/renaming a file directly in an author folder bumps that
+    folder's mtime, which is exactly where orphans live.
+    """
+    sig = [os.stat(lib_path).st_mtime_ns]
+    with os.scandir(lib_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                sig.append((entry.name, entry.stat().st_mtime_ns))
+    return tuple(sig)
+
+
+def find_orphan_audio_files_cached(lib_path):
+    """find_orphan_audio_files() with a per-library cache keyed on folder mtimes."""
+    with _orphan_cache_lock:  # Concurrent requests share one walk instead of racing
+        try:
+            signature = _orphan_scan_signature(lib_path)
+        except OSError:
+            _orphan_cache.pop(lib_path, None)
+            return find_orphan_audio_files(lib_path)
+
+        cached = _orphan_cache.get(lib_path)
+        if cached and cached[0] == signature and time.time() - cached[2] < ORPHAN_CACHE_TTL:
+            return cached[1]
+
+        orphans = find_orphan_audio_files(lib_path)
+        _orphan_cache[lib_path] = (signature, orphans, time.time())
+        return orphans
+
+
+def invalidate_orphan_cache(lib_path=None):
+    """Drop cached orphan results for one library (or all of them)."""
+    with _orphan_cache_lock:
+        if lib_path is None:
+            _orphan_cache.clear()
+        else:
+            _orphan_cache.pop(lib_path, None)
+
+
+_ORPHAN_TITLE_JUNK_RE = re.compile(
+    r'\s*(?:\((?:Unabridged|Abridged|MP3|M4B|64k|128k|HQ|Complete|Full|Retail)\)|\[.*?\])',
+    re.IGNORECASE
+)
+_ILLEGAL_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+
 def organize_orphan_files(author_path, book_title, files, config=None):
     """Create a book folder and move orphan files into it."""
     import shutil
@@ -2016,10 +2692,9 @@ def organize_orphan_files(author_path, book_title, files, config=None):
     # Clean up the book title for folder name
     clean_title = book_title
 
-    # Remove format/quality junk from title
-    clean_title = re.sub(r'\s*\((?:Unabridged|Abridged|MP3|M4B|64k|128k|HQ|Complete|Full|Retail)\)', '', clean_title, flags=re.IGNORECASE)
-    clean_title = re.sub(r'\s*\[.*?\]', '', clean_title)  # Remove bracketed content
-    clean_title = re.sub(r'[<>:"/\\|?*]', '', clean_title)  # Remove illegal chars
+    # Remove format/quality junk and bracketed content from title
+    clean_title = _ORPHAN_TITLE_JUNK_RE.sub('', clean_title)
+    clean_title = clean_title.translate(_ILLEGAL_FILENAME_CHARS)
     clean_title = clean_title.strip()
 
     if not clean_title:
@@ -2044,7 +2719,11 @@ def organize_orphan_files(author_path, book_title, files, config=None):
             src = Path(file_path)
             if src.exists():
                 dest = book_dir / src.name
-                shutil.move(str(src), str(dest))
+                try:
+                    # Same author folder, so normally the same filesystem: a plain rename
+                    os.replace(src, dest)
+                except OSError:
+                    shutil.move(str(src), str(dest))  # e.g. EXDEV on odd mounts - copy + delete
                 moved += 1
         except Exception as e:
             errors.append(f"{file_path}: {e}")
@@ -2630,7 +3309,7 @@ def handle_chaos_library(lib_path, config=None):
     # Find all loose audio files in root
     loose_files = [
         f for f in lib_root.iterdir()
-        if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS
+        if is_audio_filename(f.name) and f.is_file()
     ]
 
     if not loose_files:
@@ -2755,31 +3434,208 @@ def handle_chaos_library(lib_path, config=None):
     return results
 
 
+@functools.lru_cache(maxsize=4096)
 def is_disc_chapter_folder(name):
     """Check if folder name looks like a disc/chapter subfolder."""
     name_lower = name.lower()
-    for pattern in DISC_CHAPTER_PATTERNS:
-        if re.search(pattern, name_lower, re.IGNORECASE):
-            return True
-    return False
+    return bool(_DISC_CHAPTER_RE.search(name_lower))
 
 
 def clean_title(title):
     """Remove junk from title, return (cleaned_title, issues_found)."""
+    cleaned, issues = _clean_title_cached(title)
+    return cleaned, list(issues)
+
+
+@functools.lru_cache(maxsize=8192)
+def _clean_title_cached(title):
+    """clean_title() with the issues as a tuple, so the cached result can't be mutated by a caller."""
     issues = []
     cleaned = title
 
-    for pattern in JUNK_PATTERNS:
-        if re.search(pattern, cleaned, re.IGNORECASE):
-            issues.append(f"junk: {pattern}")
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+    # Patterns are applied one after another (removing one can expose another),
+    # so only walk them individually when the combined scan finds something
+    if not _JUNK_TRIGGER_CHARS.isdisjoint(cleaned) and _JUNK_ANY_RE.search(cleaned):
+        for pattern, junk_re in _JUNK_RES:
+            if junk_re.search(cleaned):
+                issues.append(f"junk: {pattern}")
+                cleaned = junk_re.sub('', cleaned)
 
     # Clean up extra whitespace and dashes
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    cleaned = re.sub(r'^[-_\s]+|[-_\s]+$', '', cleaned)
-    cleaned = re.sub(r'\s*-\s*$', '', cleaned)
+    cleaned = ' '.join(cleaned.split())
+    # Whitespace is now single spaces, so this also covers a trailing " - "
+    cleaned = cleaned.strip('-_ ')
+
+    return cleaned, tuple(issues)
+
+
+# Folder-name classifiers used by analyze_full_path
+_PERSON_NAME_RE = _any_of((
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+$',           # First Last
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+$',  # First Middle Last
+    r'^[A-Z]\.\s*[A-Z][a-z]+$',               # F. Last
+    r'^[A-Z][a-z]+\s+[A-Z]\.\s*[A-Z][a-z]+$', # First M. Last
+    r'^[A-Z][a-z]+,\s+[A-Z][a-z]+$',          # Last, First
+    r'^[A-Z]\.([A-Z]\.)+\s*[A-Z][a-z]+$',     # J.R.R. Tolkien
+))
+_DISC_FOLDER_RE = _any_of((
+    r'^(disc|disk|cd|dvd)\s*\d+',
+    r'^(part|chapter|ch)\s*\d+',
+    r'^\d+\s*[-–]\s*(disc|disk|cd|part)',
+    r'^(side)\s*[ab12]',
+    r'^\d{1,2}$',  # Just a number like "1", "01"
+), re.IGNORECASE)
+_BOOK_NUMBER_RE = _any_of((
+    r'^(book|vol|volume|part)\s*\d+',
+    r'^\d+\s*[-–:.]\s*\w',  # "01 - Title", "1. Title"
+    r'^#?\d+\s*[-–:]',      # "#1 - Title"
+), re.IGNORECASE)
+_TITLE_YEAR_RE = re.compile(r'\b(19[0-9]{2}|20[0-9]{2})\b')
+# Series often have: numbers, "series", "saga", "chronicles", or are the same as child folder
+_SERIES_WORD_RE = _any_of((
+    r'\bseries\b', r'\bsaga\b', r'\bchronicles\b', r'\btrilogy\b',
+    r'\bcycle\b', r'\buniverse\b', r'\bbooks?\b',
+), re.IGNORECASE)
+_BOOK_NUM_TITLE_RE = re.compile(r'^(.+?)\s*(?:book|vol)\s*\d+\s*[-–:]\s*(.+)$', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def looks_like_person_name(name):
+    """Check if name looks like a person's name (First Last pattern)."""
+    return bool(_PERSON_NAME_RE.match(name))
+
+
+@functools.lru_cache(maxsize=4096)
+def looks_like_disc_chapter(name):
+    """Check if folder is a disc/chapter/part folder (not meaningful for title)."""
+    return bool(_DISC_FOLDER_RE.search(name))
+
+
+@functools.lru_cache(maxsize=4096)
+def looks_like_book_number(name):
+    """Check if folder indicates a numbered book in series."""
+    return bool(_BOOK_NUMBER_RE.search(name))
+
+
+def looks_like_title_with_year(name):
+    """Check if name looks like a title with a year (series/book name)."""
+    return bool(_TITLE_YEAR_RE.search(name))
+
+
+@functools.lru_cache(maxsize=4096)
+def looks_like_series_name(name):
+    """Check if name looks like a series name."""
+    return bool(_SERIES_WORD_RE.search(name))
+
+
+# BookDB lookups for analyze_full_path. LOWER(name) can't use an index, so
+# every query was a full table scan: instead the authors/series name columns
+# are snapshotted into memory once (reloaded if the BookDB file changes) and
+# every check is a set lookup.
+_bookdb_local = threading.local()
+_SERIES_NAME_STRIP_RE = re.compile(r'[^\w\s]')
+_AUTHOR_NAME_STRIP_RE = re.compile(r'[^\w\s\.]')
+_SQL_LOWER = {c: c + 32 for c in range(ord('A'), ord('Z') + 1)}  # SQLite LOWER() is ASCII-only
+
+_bookdb_names = {'mtime': None, 'authors': frozenset(), 'series': frozenset(), 'series_keys': frozenset()}
+_bookdb_names_lock = threading.Lock()
+
+
+def _bookdb_thread_connection():
+    """This thread's BookDB connection (None if the database isn't available)."""
+    conn = getattr(_bookdb_local, 'conn', None)
+    if conn is None:
+        conn = _bookdb_local.conn = get_bookdb_connection()
+    return conn
+
+
+def _drop_bookdb_thread_connection():
+    """Forget this thread's BookDB connection after an error so the next lookup reconnects."""
+    conn = getattr(_bookdb_local, 'conn', None)
+    _bookdb_local.conn = None
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _series_match_key(name):
+    """Loose series key: lowercase, no punctuation, no leading "The"."""
+    key = _SERIES_NAME_STRIP_RE.sub('', name.lower()).strip()
+    return key[4:].lstrip() if key.startswith('the ') else key
+
 
-    return cleaned, issues
+def load_bookdb_name_sets():
+    """
+    Return (authors, series, series_keys): frozensets of LOWER(name) for the
+    BookDB tables, plus _series_match_key() of every series name.
+    Loaded on first use and again whenever the BookDB file changes.
+    Raises if BookDB can't be read, so callers can report the lookup as failed.
+    """
+    mtime = os.stat(BOOKDB_LOCAL_PATH).st_mtime_ns
+    with _bookdb_names_lock:
+        if _bookdb_names['mtime'] != mtime:
+            cursor = _bookdb_thread_connection().cursor()
+            authors = frozenset(n for (n,) in cursor.execute("SELECT LOWER(name) FROM authors") if n is not None)
+            series = frozenset(n for (n,) in cursor.execute("SELECT LOWER(name) FROM series") if n is not None)
+            series_keys = frozenset(_series_match_key(n) for n in series)
+            _bookdb_names.update(mtime=mtime, authors=authors, series=series, series_keys=series_keys)
+            logger.info(f"Loaded BookDB name sets: {len(authors)} authors, {len(series)} series")
+        return _bookdb_names['authors'], _bookdb_names['series'], _bookdb_names['series_keys']
+
+
+def _bookdb_has_series(name):
+    """Exact-then-loose series match. Raises on DB errors."""
+    _, known_series, series_keys = load_bookdb_name_sets()
+    clean_name = _SERIES_NAME_STRIP_RE.sub('', name).strip()
+    # Try exact match first
+    if clean_name.translate(_SQL_LOWER) in known_series:
+        return True
+    # Loose match - handle "Dark Tower" matching "The Dark Tower"
+    # Also handle "Wheel of Time" matching "The Wheel of Time"
+    return _series_match_key(name) in series_keys
+
+
+def _bookdb_has_author(name):
+    """Exact author match. Raises on DB errors."""
+    known_authors = load_bookdb_name_sets()[0]
+    clean_name = _AUTHOR_NAME_STRIP_RE.sub('', name).strip()
+    return clean_name.translate(_SQL_LOWER) in known_authors
+
+
+def is_known_series(name):
+    """
+    Check if name matches a series in our database (ignoring case, punctuation and a leading "The").
+    Returns: (found: bool, lookup_succeeded: bool)
+    - (True, True) = found in database
+    - (False, True) = not found, but lookup worked
+    - (False, False) = lookup failed (connection error, etc)
+    """
+    try:
+        if _bookdb_thread_connection():
+            return (_bookdb_has_series(name), True)
+    except Exception as e:
+        _drop_bookdb_thread_connection()
+        logging.debug(f"Series lookup failed for '{name}': {e}")
+    return (False, False)  # Lookup failed
+
+
+def is_known_author(name):
+    """
+    Check if name matches an author in our database.
+    Returns: (found: bool, lookup_succeeded: bool)
+    - (True, True) = found in database
+    - (False, True) = not found, but lookup worked
+    - (False, False) = lookup failed (connection error, etc)
+    """
+    try:
+        if _bookdb_thread_connection():
+            return (_bookdb_has_author(name), True)
+    except Exception as e:
+        _drop_bookdb_thread_connection()
+        logging.debug(f"Author lookup failed for '{name}': {e}")
+    return (False, False)  # Lookup failed
 
 
 def analyze_full_path(audio_file_path, library_root):
@@ -2822,107 +3678,8 @@ def analyze_full_path(audio_file_path, library_root):
     folders = parts[:-1]
 
     # Classify each folder from BOTTOM to TOP
-    folder_roles = {}
-    issues = []
-
-    def looks_like_person_name(name):
-        """Check if name looks like a person's name (First Last pattern)."""
-        patterns = [
-            r'^[A-Z][a-z]+\s+[A-Z][a-z]+$',           # First Last
-            r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+$',  # First Middle Last
-            r'^[A-Z]\.\s*[A-Z][a-z]+$',               # F. Last
-            r'^[A-Z][a-z]+\s+[A-Z]\.\s*[A-Z][a-z]+$', # First M. Last
-            r'^[A-Z][a-z]+,\s+[A-Z][a-z]+$',          # Last, First
-            r'^[A-Z]\.([A-Z]\.)+\s*[A-Z][a-z]+$',     # J.R.R. Tolkien
-        ]
-        return any(re.match(p, name) for p in patterns)
-
-    def looks_like_disc_chapter(name):
-        """Check if folder is a disc/chapter/part folder (not meaningful for title)."""
-        patterns = [
-            r'^(disc|disk|cd|dvd)\s*\d+',
-            r'^(part|chapter|ch)\s*\d+',
-            r'^\d+\s*[-–]\s*(disc|disk|cd|part)',
-            r'^(side)\s*[ab12]',
-            r'^\d{1,2}$',  # Just a number like "1", "01"
-        ]
-        return any(re.search(p, name, re.IGNORECASE) for p in patterns)
-
-    def looks_like_book_number(name):
-        """Check if folder indicates a numbered book in series."""
-        patterns = [
-            r'^(book|vol|volume|part)\s*\d+',
-            r'^\d+\s*[-–:.]\s*\w',  # "01 - Title", "1. Title"
-            r'^#?\d+\s*[-–:]',      # "#1 - Title"
-        ]
-        return any(re.search(p, name, re.IGNORECASE) for p in patterns)
-
-    def looks_like_title_with_year(name):
-        """Check if name looks like a title with a year (series/book name)."""
-        return bool(re.search(r'\b(19[0-9]{2}|20[0-9]{2})\b', name))
-
-    def looks_like_series_name(name):
-        """Check if name looks like a series name."""
-        # Series often have: numbers, "series", "saga", "chronicles", or are the same as child folder
-        patterns = [
-            r'\bseries\b', r'\bsaga\b', r'\bchronicles\b', r'\btrilogy\b',
-            r'\bcycle\b', r'\buniverse\b', r'\bbooks?\b',
-        ]
-        return any(re.search(p, name, re.IGNORECASE) for p in patterns)
-
-    def is_known_series(name):
-        """
-        Check if name matches a series in our database (with fuzzy matching).
-        Returns: (found: bool, lookup_succeeded: bool)
-        - (True, True) = found in database
-        - (False, True) = not found, but lookup worked
-        - (False, False) = lookup failed (connection error, etc)
-        """
-        try:
-            conn = get_bookdb_connection()
-            if conn:
-                cursor = conn.cursor()
-                # Clean name for search
-                clean_name = re.sub(r'[^\w\s]', '', name).strip()
-                # Try exact match first
-                cursor.execute("SELECT COUNT(*) FROM series WHERE LOWER(name) = LOWER(?)", (clean_name,))
-                count = cursor.fetchone()[0]
-                if count > 0:
-                    conn.close()
-                    return (True, True)
-                # Try fuzzy match - handle "Dark Tower" matching "The Dark Tower"
-                # Also handle "Wheel of Time" matching "The Wheel of Time"
-                cursor.execute(
-                    "SELECT COUNT(*) FROM series WHERE LOWER(name) LIKE ? OR LOWER(name) LIKE ?",
-                    (f'%{clean_name.lower()}%', f'%the {clean_name.lower()}%')
-                )
-                count = cursor.fetchone()[0]
-                conn.close()
-                return (count > 0, True)
-        except Exception as e:
-            logging.debug(f"Series lookup failed for '{name}': {e}")
-        return (False, False)  # Lookup failed
-
-    def is_known_author(name):
-        """
-        Check if name matches an author in our database.
-        Returns: (found: bool, lookup_succeeded: bool)
-        - (True, True) = found in database
-        - (False, True) = not found, but lookup worked
-        - (False, False) = lookup failed (connection error, etc)
-        """
-        try:
-            conn = get_bookdb_connection()
-            if conn:
-                cursor = conn.cursor()
-                clean_name = re.sub(r'[^\w\s\.]', '', name).strip()
-                cursor.execute("SELECT COUNT(*) FROM authors WHERE LOWER(name) = LOWER(?)", (clean_name,))
-                count = cursor.fetchone()[0]
-                conn.close()
-                return (count > 0, True)
-        except Exception as e:
-            logging.debug(f"Author lookup failed for '{name}': {e}")
-        return (False, False)  # Lookup failed
+    folder_roles = {}
+    issues = []
 
     # Work from bottom (closest to files) to top
     detected_author = None
@@ -2944,7 +3701,7 @@ def analyze_full_path(audio_file_path, library_root):
             detected_title = folder
 
             # Check if this looks like "SeriesName Book N - ActualTitle"
-            book_num_match = re.match(r'^(.+?)\s*(?:book|vol)\s*\d+\s*[-–:]\s*(.+)$', folder, re.IGNORECASE)
+            book_num_match = _BOOK_NUM_TITLE_RE.match(folder)
             if book_num_match:
                 detected_series = book_num_match.group(1).strip()
                 detected_title = book_num_match.group(2).strip()
@@ -3160,6 +3917,35 @@ Return JSON only:
     return None
 
 
+def _find_audio_sample(directory, limit=15):
+    """
+    Return up to `limit` audio file paths from under directory, stopping as
+    soon as enough are found. Each folder's own files come before its
+    subfolders; hidden folders and symlinked folders are not descended into.
+    """
+    found = []
+    pending = [directory]
+    while pending:
+        subdirs = []
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.'):
+                                subdirs.append(entry.path)
+                        elif is_audio_filename(entry.name):
+                            found.append(entry.path)
+                            if len(found) >= limit:
+                                return found
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        pending.extend(reversed(subdirs))
+    return found
+
+
 def smart_analyze_path(audio_file_or_folder, library_root, config):
     """
     Smart path analysis - tries script first, falls back to AI if needed.
@@ -3170,11 +3956,10 @@ def smart_analyze_path(audio_file_or_folder, library_root, config):
 
     # If it's a folder, find an audio file inside
     if path.is_dir():
-        audio_files = list(path.rglob('*'))
-        audio_files = [f for f in audio_files if f.suffix.lower() in AUDIO_EXTENSIONS]
+        audio_files = _find_audio_sample(str(path), limit=15)
         if audio_files:
-            audio_file = str(audio_files[0])
-            sample_files = [f.name for f in audio_files[:15]]
+            audio_file = audio_files[0]
+            sample_files = [os.path.basename(f) for f in audio_files]
         else:
             return {'error': 'No audio files found'}
     else:
@@ -3212,57 +3997,84 @@ def smart_analyze_path(audio_file_or_folder, library_root, config):
     return script_result
 
 
+# Name shapes accepted by analyze_author, most common first.
+# Every shape starts with an ASCII capital, which analyze_author checks before matching.
+_AUTHOR_NAME_RE = _any_of((
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+$',           # First Last (exact)
+    r'^[A-Z][a-z]+$',                          # Single name (Plato, Madonna)
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+$',  # First Middle Last
+    r'^[A-Z]\.\s*[A-Z][a-z]+$',               # F. Last
+    r'^[A-Z][a-z]+\s+[A-Z]\.\s*[A-Z][a-z]+$', # First M. Last
+    r'^[A-Z][a-z]+,\s+[A-Z][a-z]+$',          # Last, First
+    r'^[A-Z]\.([A-Z]\.)+\s*[A-Z][a-z]+$',     # J.R.R. Tolkien, H.P. Lovecraft
+    r'^[A-Z][a-z]+\s+[A-Z]\.([A-Z]\.)+\s*[A-Z][a-z]+$',  # George R.R. Martin
+    r'^[A-Z][a-z]+\s+[A-Z]\.[A-Z]\.\s*[A-Z][a-z]+$',     # Brandon R.R. Author
+    r'^[A-Z][a-z]+\s+[A-Z]\.\s*(Le|De|Von|Van|La|Du)\s+[A-Z][a-z]+$',  # Ursula K. Le Guin
+    r'^[A-Z][a-z]+\s+(Le|De|Von|Van|La|Du)\s+[A-Z][a-z]+$',  # Anne De Vries
+))
+_DIGIT_RE = re.compile(r'\d')
+_AUTHOR_YEAR_RE = re.compile(r'\b(19[0-9]{2}|20[0-2][0-9])\b')
+_LASTNAME_FIRSTNAME_RE = re.compile(r'^[A-Z][a-z]+,\s+[A-Z][a-z]+')
+_FORMAT_JUNK_RE = re.compile(r'\.(epub|pdf|mp3|m4b)|(\[|\]|\{|\})', re.IGNORECASE)
+_NARRATOR_SUFFIX_RE = re.compile(r'\s*-\s*[A-Z][a-z]+\s+[A-Z][a-z]+$')
+_ALL_DIGITS_RE = re.compile(r'^\d+$')
+_LEADING_NUMBER_RE = re.compile(r'^\d+\s')
+_AUTHOR_BOOK_NUMBER_RE = re.compile(r'\bbook\s*\d|\bpart\s*\d|\bvolume\s*\d', re.IGNORECASE)
+
+# System/junk folder names - these should NEVER be processed as books
+_SYSTEM_FOLDER_NAMES = frozenset({'metadata', 'tmp', 'temp', 'cache', 'config', 'data', 'logs', 'log',
+                                  'backup', 'backups', 'old', 'new', 'test', 'tests', 'sample', 'samples',
+                                  '.thumbnails', 'thumbnails', 'covers', 'images', 'artwork', 'art',
+                                  'extras', 'bonus', 'misc', 'other', 'various', 'unknown', 'unsorted',
+                                  'downloads', 'incoming', 'processing', 'completed', 'done', 'failed',
+                                  'streams', 'chapters', 'parts', 'disc', 'disk', 'cd', 'dvd'})
+# Words that are clearly NOT first names (adjectives, articles, title starters)
+_NOT_FIRST_NAMES = frozenset({'last', 'first', 'final', 'dark', 'shadow', 'night', 'blood', 'death',
+                              'city', 'house', 'world', 'kingdom', 'empire', 'war', 'game', 'fire',
+                              'ice', 'storm', 'the', 'a', 'an', 'of', 'and', 'in', 'to', 'for',
+                              'new', 'old', 'black', 'white', 'red', 'blue', 'green', 'golden',
+                              'lost', 'forgotten', 'hidden', 'secret', 'ancient', 'eternal'})
+# Words that are clearly NOT surnames (plural nouns, abstract concepts)
+_NOT_SURNAMES = frozenset({'chances', 'secrets', 'lies', 'dreams', 'tales', 'chronicles', 'stories',
+                           'wishes', 'memories', 'shadows', 'nights', 'days', 'years', 'wars',
+                           'games', 'fires', 'storms', 'kingdoms', 'empires', 'worlds', 'houses',
+                           'cities', 'deaths', 'lives', 'loves', 'hearts', 'souls', 'minds',
+                           'stars', 'moons', 'suns', 'gods', 'demons', 'angels', 'dragons',
+                           'kings', 'queens', 'lords', 'princes', 'witches', 'wizards'})
+# Words that suggest a title when the author folder is not name-shaped
+_AUTHOR_TITLE_WORDS = frozenset({'the', 'of', 'and', 'a', 'in', 'to', 'for', 'book', 'series', 'volume',
+                                 'last', 'first', 'final', 'dark', 'shadow', 'night', 'blood', 'death',
+                                 'city', 'house', 'world', 'kingdom', 'empire', 'war', 'game', 'fire',
+                                 'ice', 'storm', 'king', 'queen', 'lord', 'lady', 'prince', 'dragon',
+                                 'chances', 'secrets', 'lies', 'dreams', 'tales', 'chronicles'})
+
+
 def analyze_author(author):
     """Analyze author name for issues, return list of issues."""
+    return list(_analyze_author_cached(author))
+
+
+@functools.lru_cache(maxsize=8192)
+def _analyze_author_cached(author):
+    """analyze_author() as a tuple, cached like _analyze_title_cached."""
     issues = []
 
     # System/junk folder names - these should NEVER be processed as books
-    system_folders = {'metadata', 'tmp', 'temp', 'cache', 'config', 'data', 'logs', 'log',
-                      'backup', 'backups', 'old', 'new', 'test', 'tests', 'sample', 'samples',
-                      '.thumbnails', 'thumbnails', 'covers', 'images', 'artwork', 'art',
-                      'extras', 'bonus', 'misc', 'other', 'various', 'unknown', 'unsorted',
-                      'downloads', 'incoming', 'processing', 'completed', 'done', 'failed',
-                      'streams', 'chapters', 'parts', 'disc', 'disk', 'cd', 'dvd'}
-    if author.lower() in system_folders:
+    if author.lower() in _SYSTEM_FOLDER_NAMES:
         issues.append("system_folder_not_author")
-        return issues  # Don't bother checking anything else
+        return tuple(issues)  # Don't bother checking anything else
+
+    # The year/number checks below all need a digit - most author names have none
+    has_digit = _DIGIT_RE.search(author) is not None
 
     # Year in author name
-    if re.search(r'\b(19[0-9]{2}|20[0-2][0-9])\b', author):
+    if has_digit and _AUTHOR_YEAR_RE.search(author):
         issues.append("year_in_author")
 
-    # Words that are clearly NOT first names (adjectives, articles, title starters)
-    not_first_names = {'last', 'first', 'final', 'dark', 'shadow', 'night', 'blood', 'death',
-                       'city', 'house', 'world', 'kingdom', 'empire', 'war', 'game', 'fire',
-                       'ice', 'storm', 'the', 'a', 'an', 'of', 'and', 'in', 'to', 'for',
-                       'new', 'old', 'black', 'white', 'red', 'blue', 'green', 'golden',
-                       'lost', 'forgotten', 'hidden', 'secret', 'ancient', 'eternal'}
-
-    # Words that are clearly NOT surnames (plural nouns, abstract concepts)
-    not_surnames = {'chances', 'secrets', 'lies', 'dreams', 'tales', 'chronicles', 'stories',
-                    'wishes', 'memories', 'shadows', 'nights', 'days', 'years', 'wars',
-                    'games', 'fires', 'storms', 'kingdoms', 'empires', 'worlds', 'houses',
-                    'cities', 'deaths', 'lives', 'loves', 'hearts', 'souls', 'minds',
-                    'stars', 'moons', 'suns', 'gods', 'demons', 'angels', 'dragons',
-                    'kings', 'queens', 'lords', 'princes', 'witches', 'wizards'}
-
     author_words = author.lower().split()
 
     # Check if it structurally looks like a name
-    name_patterns = [
-        r'^[A-Z][a-z]+\s+[A-Z][a-z]+$',           # First Last (exact)
-        r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+$',  # First Middle Last
-        r'^[A-Z]\.\s*[A-Z][a-z]+$',               # F. Last
-        r'^[A-Z][a-z]+\s+[A-Z]\.\s*[A-Z][a-z]+$', # First M. Last
-        r'^[A-Z][a-z]+,\s+[A-Z][a-z]+$',          # Last, First
-        r'^[A-Z][a-z]+$',                          # Single name (Plato, Madonna)
-        r'^[A-Z]\.([A-Z]\.)+\s*[A-Z][a-z]+$',     # J.R.R. Tolkien, H.P. Lovecraft
-        r'^[A-Z][a-z]+\s+[A-Z]\.([A-Z]\.)+\s*[A-Z][a-z]+$',  # George R.R. Martin
-        r'^[A-Z][a-z]+\s+[A-Z]\.[A-Z]\.\s*[A-Z][a-z]+$',     # Brandon R.R. Author
-        r'^[A-Z][a-z]+\s+[A-Z]\.\s*(Le|De|Von|Van|La|Du)\s+[A-Z][a-z]+$',  # Ursula K. Le Guin
-        r'^[A-Z][a-z]+\s+(Le|De|Von|Van|La|Du)\s+[A-Z][a-z]+$',  # Anne De Vries
-    ]
-    looks_like_name = any(re.match(p, author) for p in name_patterns)
+    looks_like_name = 'A' <= author[:1] <= 'Z' and bool(_AUTHOR_NAME_RE.match(author))
 
     # Even if it LOOKS like a name structurally, check if the words are actually name-like
     if looks_like_name and len(author_words) >= 2:
@@ -3270,26 +4082,21 @@ def analyze_author(author):
         last_word = author_words[-1]
 
         # "Last Chances" - first word is adjective, last word is plural noun = NOT a name
-        if first_word in not_first_names and last_word in not_surnames:
+        if first_word in _NOT_FIRST_NAMES and last_word in _NOT_SURNAMES:
             looks_like_name = False
             issues.append("title_fragment_not_name")
         # "Last Something" - first word alone is a red flag if not a real first name
-        elif first_word in not_first_names and last_word in not_surnames:
+        elif first_word in _NOT_FIRST_NAMES and last_word in _NOT_SURNAMES:
             looks_like_name = False
             issues.append("title_words_in_author")
         # "Something Chances" - second word is clearly not a surname
-        elif last_word in not_surnames:
+        elif last_word in _NOT_SURNAMES:
             looks_like_name = False
             issues.append("not_a_surname")
 
     # Only flag title words if it DOESN'T look like a valid name
     if not looks_like_name:
-        title_words = ['the', 'of', 'and', 'a', 'in', 'to', 'for', 'book', 'series', 'volume',
-                       'last', 'first', 'final', 'dark', 'shadow', 'night', 'blood', 'death',
-                       'city', 'house', 'world', 'kingdom', 'empire', 'war', 'game', 'fire',
-                       'ice', 'storm', 'king', 'queen', 'lord', 'lady', 'prince', 'dragon',
-                       'chances', 'secrets', 'lies', 'dreams', 'tales', 'chronicles']
-        if any(w in author_words for w in title_words):
+        if not _AUTHOR_TITLE_WORDS.isdisjoint(author_words):
             issues.append("title_words_in_author")
 
         # Two+ words but doesn't match name patterns - probably a title
@@ -3297,115 +4104,156 @@ def analyze_author(author):
             issues.append("not_a_name_pattern")
 
     # LastName, FirstName format
-    if re.match(r'^[A-Z][a-z]+,\s+[A-Z][a-z]+', author):
+    if _LASTNAME_FIRSTNAME_RE.match(author):
         issues.append("lastname_firstname_format")
 
     # Format indicators
-    if re.search(r'\.(epub|pdf|mp3|m4b)|(\[|\]|\{|\})', author, re.IGNORECASE):
+    if _FORMAT_JUNK_RE.search(author):
         issues.append("format_junk_in_author")
 
     # Narrator included (usually with hyphen)
-    if re.search(r'\s*-\s*[A-Z][a-z]+\s+[A-Z][a-z]+$', author):
+    if _NARRATOR_SUFFIX_RE.search(author):
         issues.append("possible_narrator_in_author")
 
-    # Just numbers
-    if re.match(r'^\d+$', author):
-        issues.append("author_is_just_numbers")
+    if has_digit:
+        # Just numbers
+        if _ALL_DIGITS_RE.match(author):
+            issues.append("author_is_just_numbers")
+
+        # Starts with number (might be book title)
+        if _LEADING_NUMBER_RE.match(author):
+            issues.append("author_starts_with_number")
+
+        # Contains "Book N" or "Part N" - probably a title
+        if _AUTHOR_BOOK_NUMBER_RE.search(author):
+            issues.append("author_contains_book_number")
 
-    # Starts with number (might be book title)
-    if re.match(r'^\d+\s', author):
-        issues.append("author_starts_with_number")
+    return tuple(issues)
 
-    # Contains "Book N" or "Part N" - probably a title
-    if re.search(r'\bbook\s*\d|\bpart\s*\d|\bvolume\s*\d', author, re.IGNORECASE):
-        issues.append("author_contains_book_number")
 
-    return issues
+# Be conservative - only flag patterns that DEFINITELY mean multiple books (matched against the lowercased title)
+_MULTI_BOOK_RE = _any_of((
+    r'complete\s+series',           # "Complete Series"
+    r'complete\s+audio\s+collection', # "Complete Audio Collection"
+    r'\d+[-\s]?book\s+(set|box|collection)',  # "7-Book Set", "3 Book Collection"
+    r'\d+[-\s]?book\s+and\s+audio',  # "7-Book and Audio Box Set"
+    r'all\s+\d+\s+books',            # "All 9 Books"
+    r'books?\s+\d+[-\s]?\d+',        # "Books 1-9", "Book 1-3"
+))
+_TITLE_YEAR_IN_RE = re.compile(r'\(?(19[5-9][0-9]|20[0-2][0-9])\)?')
+_QUALITY_INFO_RE = re.compile(r'\d+k\b|\d+kbps|\d+mb|\d+gb', re.IGNORECASE)
+_NARRATOR_PAREN_RE = re.compile(r'\([A-Z][a-z]+\)\s*$')
+_DURATION_RE = re.compile(r'\d{1,2}\.\d{2}\.\d{2}')
+_SERIES_PREFIX_RE = re.compile(r'^.+\s+book\s+\d+\s*[-:]\s*.+', re.IGNORECASE)
+_CATALOG_ID_RE = re.compile(r'\[\d{4,}\]')
 
 
 def analyze_title(title, author):
     """Analyze title for issues, return list of issues."""
+    return list(_analyze_title_cached(title, author))
+
+
+_NAME_FILLER_WORDS = frozenset({'the', 'a', 'of', 'and'})  # A two-word title containing one isn't a name
+
+
+@functools.lru_cache(maxsize=8192)
+def _analyze_title_cached(title, author):
+    """analyze_title() as a tuple, cached - repeat scans see the same folder names every time."""
     issues = []
 
     # Multi-book collection folder - these contain multiple books and need special handling
     # Don't process these as single books - they need to be split first
-    # Be conservative - only flag patterns that DEFINITELY mean multiple books
-    multi_book_patterns = [
-        r'complete\s+series',           # "Complete Series"
-        r'complete\s+audio\s+collection', # "Complete Audio Collection"
-        r'\d+[-\s]?book\s+(set|box|collection)',  # "7-Book Set", "3 Book Collection"
-        r'\d+[-\s]?book\s+and\s+audio',  # "7-Book and Audio Box Set"
-        r'all\s+\d+\s+books',            # "All 9 Books"
-        r'books?\s+\d+[-\s]?\d+',        # "Books 1-9", "Book 1-3"
-    ]
     title_lower = title.lower()
-    if any(re.search(p, title_lower) for p in multi_book_patterns):
+    if _MULTI_BOOK_RE.search(title_lower):
         issues.append("multi_book_collection")
-        return issues  # Don't bother with other checks - this needs manual handling
+        return tuple(issues)  # Don't bother with other checks - this needs manual handling
 
     # Author name repeated in title
-    author_parts = author.lower().split()
-    if len(author_parts) >= 2:
-        if author.lower() in title.lower():
+    author_lower = author.lower()
+    if len(author_lower.split()) >= 2:
+        if author_lower in title_lower:
             issues.append("author_in_title")
-        # Check for "by Author" pattern
-        if re.search(rf'\bby\s+{re.escape(author)}\b', title, re.IGNORECASE):
+        # Check for "by Author" pattern (the regex is built per author, so only when "by" occurs at all)
+        if 'by' in title_lower and re.search(rf'\bby\s+{re.escape(author)}\b', title, re.IGNORECASE):
             issues.append("by_author_in_title")
 
+    # Year, quality, duration, series-number and catalog-ID checks all need a digit
+    has_digit = _DIGIT_RE.search(title) is not None
+
     # Year in title (but not book number like "1984")
-    year_match = re.search(r'\(?(19[5-9][0-9]|20[0-2][0-9])\)?', title)
-    if year_match:
+    if has_digit and _TITLE_YEAR_IN_RE.search(title):
         issues.append("year_in_title")
 
     # Quality/bitrate info
-    if re.search(r'\d+k\b|\d+kbps|\d+mb|\d+gb', title, re.IGNORECASE):
+    if has_digit and _QUALITY_INFO_RE.search(title):
         issues.append("quality_info_in_title")
 
     # Narrator name pattern (Name) at end
-    if re.search(r'\([A-Z][a-z]+\)\s*$', title):
+    if _NARRATOR_PAREN_RE.search(title):
         issues.append("possible_narrator_in_title")
 
-    # Duration pattern HH.MM.SS
-    if re.search(r'\d{1,2}\.\d{2}\.\d{2}', title):
-        issues.append("duration_in_title")
+    if has_digit:
+        # Duration pattern HH.MM.SS
+        if _DURATION_RE.search(title):
+            issues.append("duration_in_title")
 
-    # Series prefix like "Series Name Book 1 -"
-    if re.search(r'^.+\s+book\s+\d+\s*[-:]\s*.+', title, re.IGNORECASE):
-        issues.append("series_prefix_format")
+        # Series prefix like "Series Name Book 1 -"
+        if _SERIES_PREFIX_RE.search(title):
+            issues.append("series_prefix_format")
 
-    # Brackets with numbers (catalog IDs)
-    if re.search(r'\[\d{4,}\]', title):
-        issues.append("catalog_id_in_title")
+        # Brackets with numbers (catalog IDs)
+        if _CATALOG_ID_RE.search(title):
+            issues.append("catalog_id_in_title")
 
     # Title looks like author name (just 2 capitalized words)
     title_words = title.split()
-    if len(title_words) == 2 and all(w[0].isupper() for w in title_words if w):
-        if not any(w.lower() in ['the', 'a', 'of', 'and'] for w in title_words):
+    if len(title_words) == 2 and title_words[0][0].isupper() and title_words[1][0].isupper():
+        if _NAME_FILLER_WORDS.isdisjoint(title_lower.split()):
             issues.append("title_looks_like_author")
 
-    return issues
+    return tuple(issues)
+
+
+def _find_files_by_extension(directory, extensions):
+    """
+    Recursively list files under directory whose extension (lowercase, no dot,
+    e.g. _AUDIO_EXT_NODOT) is in extensions. Same results and order as an
+    os.walk() loop with os.path.splitext (symlinked folders aren't descended
+    into), but straight off os.scandir entries.
+    """
+    found = []
+    pending = [os.fspath(directory)]
+    while pending:
+        subdirs = []
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        stem, _, ext = entry.name.rpartition('.')
+                        # splitext ignores leading dots, so ".mp3" or "..mp3" has no extension
+                        if ext.lower() in extensions and stem.lstrip('.'):
+                            found.append(entry.path)
+        except OSError:
+            continue
+        pending.extend(reversed(subdirs))  # Depth-first in listing order, like os.walk
+    return found
 
 
 def find_audio_files(directory):
     """Recursively find all audio files in directory."""
-    audio_files = []
-    for root, dirs, files in os.walk(directory):
-        for f in files:
-            ext = os.path.splitext(f)[1].lower()
-            if ext in AUDIO_EXTENSIONS:
-                audio_files.append(os.path.join(root, f))
-    return audio_files
+    return _find_files_by_extension(directory, _AUDIO_EXT_NODOT)
 
 
 def find_ebook_files(directory):
     """Recursively find all ebook files in directory."""
-    ebook_files = []
-    for root, dirs, files in os.walk(directory):
-        for f in files:
-            ext = os.path.splitext(f)[1].lower()
-            if ext in EBOOK_EXTENSIONS:
-                ebook_files.append(os.path.join(root, f))
-    return ebook_files
+    return _find_files_by_extension(directory, _EBOOK_EXT_NODOT)
 
 
 def check_audio_file_health(file_path):
@@ -3451,18 +4299,172 @@ def check_audio_file_health(file_path):
         return {'valid': False, 'duration': None, 'error': str(e)}
 
 
-def get_file_signature(filepath, sample_size=8192):
-    """Get a signature for duplicate detection (size + partial hash)."""
+def get_file_signature(filepath, sample_size=8192, size=None):
+    """Get a signature for duplicate detection: (size, 8-byte hash of the first sample_size bytes).
+
+    Only used to group candidate duplicates, so a short digest is enough. blake2b
+    is in the stdlib, faster than MD5, and still available on FIPS builds.
+    """
     try:
-        size = os.path.getsize(filepath)
-        with open(filepath, 'rb') as f:
-            sample = f.read(sample_size)
-        partial_hash = hashlib.md5(sample).hexdigest()[:16]
-        return f"{size}_{partial_hash}"
+        if size is None:
+            size = os.path.getsize(filepath)
+        # Raw fd read: open() would add an fstat and a buffered file object for one read
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            sample = os.read(fd, sample_size)
+        finally:
+            os.close(fd)
+        return (size, hashlib.blake2b(sample, digest_size=8).digest())
     except:
         return None
 
 
+# deep_scan_library: subfolders that look like separate books (2+ means a series folder)
+_BOOK_FOLDER_RE = _any_of((
+    r'^\d+\s*[-–—:.]?\s*\w',     # "01 Title", "1 - Title", "01. Title"
+    r'^#?\d+\s*[-–—:]',          # "#1 - Title"
+    r'book\s*\d+',               # "Book 1", "Book1"
+    r'vol(ume)?\s*\d+',          # "Volume 1", "Vol 1"
+    r'part\s*\d+',               # "Part 1"
+), re.IGNORECASE)
+# Book numbers in audio file names, tried in order (first hit wins)
+_BOOK_FILE_NUMBER_PATTERNS = (
+    r'book\s*(\d+)',           # "Book 1", "Book 2"
+    r'#(\d+)',                 # "#1", "#2"
+    r'^(\d+)\s*[-–—:.]',       # "01 - Title", "02 - Title"
+    r'[-_\s](\d+)[-_\s.]',     # " 1 ", "_1_", "-1-"
+    r'volume\s*(\d+)',         # "Volume 1"
+    r'vol\.?\s*(\d+)',         # "Vol 1", "Vol. 1"
+)
+_BOOK_FILE_NUMBER_RES = [re.compile(p, re.IGNORECASE) for p in _BOOK_FILE_NUMBER_PATTERNS]
+_BOOK_FILE_NUMBER_ANY_RE = _any_of(_BOOK_FILE_NUMBER_PATTERNS, re.IGNORECASE)
+# analyze_author issues that mean the "author" folder is really a title (for reversed-structure detection)
+_AUTHOR_LOOKS_LIKE_TITLE_ISSUES = frozenset({'year_in_author', 'title_words_in_author', 'author_contains_book_number',
+                                             'not_a_name_pattern', 'author_starts_with_number'})
+# Title folder that is shaped like a person's name (for reversed-structure detection)
+_TITLE_NAME_PATTERN_RE = re.compile(r'^[A-Z][a-z]+\s+[A-Z][a-z]+$|^[A-Z]\.\s*[A-Z][a-z]+$|^[A-Z][a-z]+,\s+[A-Z]')
+
+# Folders deep_scan_library never treats as an author / as a book (matched lowercased)
+_SCAN_SKIP_AUTHOR_FOLDERS = frozenset({'metadata', 'tmp', 'temp', 'cache', 'config', 'data', 'logs', 'log',
+                                       'backup', 'backups', 'old', 'new', 'test', 'tests', 'sample', 'samples',
+                                       '.thumbnails', 'thumbnails', 'covers', 'images', 'artwork', 'art',
+                                       'streams', '.streams', '.cache', '.metadata', '@eaDir', '#recycle'})
+_SCAN_SKIP_BOOK_FOLDERS = frozenset({'metadata', 'tmp', 'temp', 'cache', 'config', 'data', 'logs', 'log',
+                                     'backup', 'backups', 'old', 'new', 'test', 'tests', 'sample', 'samples',
+                                     '.thumbnails', 'thumbnails', 'covers', 'images', 'artwork', 'art',
+                                     'extras', 'bonus', 'misc', 'other', 'various', 'unknown', 'unsorted',
+                                     'downloads', 'incoming', 'processing', 'completed', 'done', 'failed',
+                                     'streams', 'chapters', 'parts', '.streams', '.cache', '.metadata'})
+
+DEEP_SCAN_HASH_WORKERS = 16  # Concurrent signature reads for duplicate candidates (config: scan_workers)
+
+
+def _book_numbers_in_files(files):
+    """Distinct book numbers in audio file names (first matching _BOOK_FILE_NUMBER_RES pattern per file)."""
+    numbers = set()
+    for f in files:
+        stem = f.stem
+        # One combined scan rules out names like "Track01" before trying the patterns in order
+        if not _BOOK_FILE_NUMBER_ANY_RE.search(stem):
+            continue
+        for pattern in _BOOK_FILE_NUMBER_RES:
+            match = pattern.search(stem)
+            if match:
+                numbers.add(match.group(1))
+                break
+    return numbers
+
+
+def _split_dir_entries(directory):
+    """
+    List a directory once as (subdirs, files) Paths in iterdir() order, using the
+    file types os.scandir already read instead of a stat() per is_dir()/is_file().
+    """
+    subdirs, files = [], []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    subdirs.append(directory / entry.name)
+                elif entry.is_file():
+                    files.append(directory / entry.name)
+            except OSError:
+                pass
+    return subdirs, files
+
+
+def _count_book_files(directory):
+    """
+    (ebook_count, audio_count) for everything below directory - what
+    Path.rglob('*') plus a suffix check gives, in a single scandir walk.
+    """
+    ebooks = audio = 0
+    pending = [os.fspath(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if is_ebook_filename(entry.name):
+                        ebooks += 1
+                    elif is_audio_filename(entry.name):
+                        audio += 1
+                    try:
+                        if entry.is_dir() and not entry.is_symlink():
+                            pending.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            continue
+    return ebooks, audio
+
+
+def _walk_library_files(lib_path):
+    """
+    Walk a library once for the deep scan: returns (audio_files, title_counts).
+
+    audio_files is exactly find_audio_files(lib_path). title_counts maps each
+    Author/Title folder the walk went into to [ebook_count, audio_count], the
+    same numbers _count_book_files() would give, so the scan doesn't walk every
+    book folder a second time. Folders the walk doesn't enter (symlinks) are
+    missing and have to be counted separately.
+    """
+    audio_files = []
+    title_counts = {}
+    pending = [(os.fspath(lib_path), 0, None)]  # (folder, depth below lib_path, its title's counts)
+    while pending:
+        directory, depth, counts = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if counts is not None:
+                        if is_ebook_filename(name):
+                            counts[0] += 1
+                        elif is_audio_filename(name):
+                            counts[1] += 1
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        stem, _, ext = name.rpartition('.')
+                        if ext.lower() in _AUDIO_EXT_NODOT and stem.lstrip('.'):
+                            audio_files.append(entry.path)
+        except OSError:
+            continue
+        for subdir in reversed(subdirs):  # Depth-first in listing order, like find_audio_files
+            if depth == 1:
+                title_counts[subdir] = [0, 0]  # lib/Author/Title
+                pending.append((subdir, 2, title_counts[subdir]))
+            else:
+                pending.append((subdir, depth + 1, counts))
+    return audio_files, title_counts
+
+
 def deep_scan_library(config):
     """
     Deep scan library - the AUTISTIC LIBRARIAN approach.
@@ -3476,10 +4478,24 @@ def deep_scan_library(config):
     queued = 0   # Books added to fix queue
     issues_found = {}  # path -> list of issues
 
-    # Track files for duplicate detection
-    file_signatures = {}  # signature -> list of paths
+    # Track files for duplicate detection. Files can only be duplicates if their
+    # sizes match, so everything is bucketed by size and only files sharing a
+    # size get read and hashed (after all libraries are walked).
+    size_buckets = {}  # size -> list of paths
     file_names = {}  # basename -> list of paths
 
+    # Folders that are skipped with a special status (series/multi-book/reversed),
+    # written in one batch per library path instead of a commit per folder
+    skipped_folder_rows = []
+    # Same for new books, queue entries and status changes: collected during the
+    # walk and written once per library path. Queue rows reference their book by
+    # path, since new books don't have an id until the batch is inserted.
+    new_book_rows = []  # (path, author, title, status)
+    loose_queue_rows = []  # (reason, added_at, priority, path)
+    requeue_rows = []  # (reason, added_at, priority, book_id) - loose files already in the queue
+    queue_rows = []  # (reason, priority, path)
+    status_rows = []  # (status, path)
+
     logger.info("=== DEEP LIBRARY SCAN STARTING ===")
 
     for lib_path_str in config.get('library_paths', []):
@@ -3490,28 +4506,35 @@ def deep_scan_library(config):
 
         logger.info(f"Scanning: {lib_path}")
 
+        # Load what's already tracked once per library instead of a lookup per folder
+        # (re-read each time, since the previous library's batch is committed by now)
+        known_books = {row['path']: (row['id'], row['status'])
+                       for row in c.execute('SELECT path, id, status FROM books')}
+        queued_book_ids = {row['book_id'] for row in c.execute('SELECT book_id FROM queue')}
+
         # First pass: Find all audio files to understand actual book locations
-        all_audio_files = find_audio_files(lib_path)
+        # (and count each book folder's ebook/audio files while we're there)
+        all_audio_files, title_file_counts = _walk_library_files(lib_path)
         logger.info(f"Found {len(all_audio_files)} audio files")
 
-        # Track file signatures for duplicate detection
+        # Track file sizes for duplicate detection
         for audio_file in all_audio_files:
-            sig = get_file_signature(audio_file)
-            if sig:
-                if sig not in file_signatures:
-                    file_signatures[sig] = []
-                file_signatures[sig].append(audio_file)
+            try:
+                size_buckets.setdefault(os.path.getsize(audio_file), []).append(audio_file)
+            except OSError:
+                pass
 
             basename = os.path.basename(audio_file).lower()
             if basename not in file_names:
                 file_names[basename] = []
             file_names[basename].append(audio_file)
 
+        # List the library root once for loose files and author folders
+        root_dirs, root_files = _split_dir_entries(lib_path)
+        queued_at = datetime.now().isoformat()  # One timestamp for this library's loose-file queue rows
+
         # NEW: Detect loose files in library root (no folder structure)
-        loose_files = []
-        for item in lib_path.iterdir():
-            if item.is_file() and item.suffix.lower() in AUDIO_EXTENSIONS:
-                loose_files.append(item)
+        loose_files = [f for f in root_files if is_audio_filename(f.name)]
 
         if loose_files:
             logger.info(f"Found {len(loose_files)} loose audio files in library root")
@@ -3522,34 +4545,24 @@ def deep_scan_library(config):
                 path_str = str(loose_file)
 
                 # Check if already in books table
-                c.execute('SELECT id FROM books WHERE path = ?', (path_str,))
-                existing = c.fetchone()
+                existing = known_books.get(path_str)  # (id, status)
+                if not existing:
+                    # Create books record for the loose file
+                    new_book_rows.append((path_str, 'Unknown', cleaned_filename, 'loose_file'))
 
-                if existing:
-                    book_id = existing['id']
+                # Add to queue with special "loose_file" reason (refresh it if already queued)
+                queue_row = (f'loose_file_needs_folder:{filename}', queued_at, 1)  # High priority
+                if existing and existing[0] in queued_book_ids:
+                    requeue_rows.append(queue_row + (existing[0],))
                 else:
-                    # Create books record for the loose file
-                    c.execute('''INSERT INTO books (path, current_author, current_title, status)
-                                VALUES (?, ?, ?, ?)''',
-                             (path_str, 'Unknown', cleaned_filename, 'loose_file'))
-                    book_id = c.lastrowid
-
-                # Add to queue with special "loose_file" reason
-                c.execute('''INSERT OR REPLACE INTO queue
-                            (book_id, reason, added_at, priority)
-                            VALUES (?, ?, ?, ?)''',
-                         (book_id, f'loose_file_needs_folder:{filename}',
-                          datetime.now().isoformat(), 1))  # High priority
-                queued += 1
+                    loose_queue_rows.append(queue_row + (path_str,))
+                    queued += 1
                 issues_found[path_str] = ['loose_file_no_folder']
                 logger.info(f"Queued loose file: {filename} -> search for: {cleaned_filename}")
 
         # NEW: Detect loose EBOOK files in library root (when ebook management enabled)
         if config.get('ebook_management', False):
-            loose_ebooks = []
-            for item in lib_path.iterdir():
-                if item.is_file() and item.suffix.lower() in EBOOK_EXTENSIONS:
-                    loose_ebooks.append(item)
+            loose_ebooks = [f for f in root_files if is_ebook_filename(f.name)]
 
             if loose_ebooks:
                 logger.info(f"Found {len(loose_ebooks)} loose ebook files in library root")
@@ -3558,63 +4571,45 @@ def deep_scan_library(config):
                     cleaned_filename = clean_search_title(filename)
                     path_str = str(loose_ebook)
 
-                    c.execute('SELECT id FROM books WHERE path = ?', (path_str,))
-                    existing = c.fetchone()
+                    existing = known_books.get(path_str)
+                    if not existing:
+                        new_book_rows.append((path_str, 'Unknown', cleaned_filename, 'ebook_loose'))
 
-                    if existing:
-                        book_id = existing['id']
+                    queue_row = (f'ebook_loose:{filename}', queued_at, 2)
+                    if existing and existing[0] in queued_book_ids:
+                        requeue_rows.append(queue_row + (existing[0],))
                     else:
-                        c.execute('''INSERT INTO books (path, current_author, current_title, status)
-                                    VALUES (?, ?, ?, ?)''',
-                                 (path_str, 'Unknown', cleaned_filename, 'ebook_loose'))
-                        book_id = c.lastrowid
-
-                    c.execute('''INSERT OR REPLACE INTO queue
-                                (book_id, reason, added_at, priority)
-                                VALUES (?, ?, ?, ?)''',
-                             (book_id, f'ebook_loose:{filename}',
-                              datetime.now().isoformat(), 2))
-                    queued += 1
+                        loose_queue_rows.append(queue_row + (path_str,))
+                        queued += 1
                     issues_found[path_str] = ['ebook_loose_file']
                     logger.info(f"Queued loose ebook: {filename}")
 
         # Second pass: Analyze folder structure
-        for author_dir in lib_path.iterdir():
-            if not author_dir.is_dir():
-                continue
-
+        for author_dir in root_dirs:
             author = author_dir.name
 
             # Skip system folders at author level - these are NEVER authors
-            author_system_folders = {'metadata', 'tmp', 'temp', 'cache', 'config', 'data', 'logs', 'log',
-                                     'backup', 'backups', 'old', 'new', 'test', 'tests', 'sample', 'samples',
-                                     '.thumbnails', 'thumbnails', 'covers', 'images', 'artwork', 'art',
-                                     'streams', '.streams', '.cache', '.metadata', '@eaDir', '#recycle'}
-            if author.lower() in author_system_folders or author.startswith('.') or author.startswith('@'):
+            if author.lower() in _SCAN_SKIP_AUTHOR_FOLDERS or author.startswith('.') or author.startswith('@'):
                 logger.debug(f"Skipping system folder at author level: {author}")
                 continue
 
             author_issues = analyze_author(author)
+            author_subdirs, author_files = _split_dir_entries(author_dir)
 
             # Check if "author" folder is actually a book (has audio files directly)
-            direct_audio = [f for f in author_dir.iterdir()
-                          if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS]
+            direct_audio = [f for f in author_files if is_audio_filename(f.name)]
             if direct_audio:
                 # This "author" folder might actually be a book!
                 issues_found[str(author_dir)] = author_issues + ["author_folder_has_audio_files"]
                 logger.warning(f"Author folder has audio files directly: {author}")
 
             # Check if author folder has NO book subfolders (just disc folders)
-            subdirs = [d for d in author_dir.iterdir() if d.is_dir()]
-            if subdirs:
-                all_disc_folders = all(is_disc_chapter_folder(d.name) for d in subdirs)
+            if author_subdirs:
+                all_disc_folders = all(is_disc_chapter_folder(d.name) for d in author_subdirs)
                 if all_disc_folders:
                     issues_found[str(author_dir)] = author_issues + ["author_folder_only_has_disc_folders"]
 
-            for title_dir in author_dir.iterdir():
-                if not title_dir.is_dir():
-                    continue
-
+            for title_dir in author_subdirs:
                 title = title_dir.name
                 path = str(title_dir)
 
@@ -3625,79 +4620,34 @@ def deep_scan_library(config):
                     continue
 
                 # Skip system/metadata folders - these are NEVER books
-                system_folders = {'metadata', 'tmp', 'temp', 'cache', 'config', 'data', 'logs', 'log',
-                                  'backup', 'backups', 'old', 'new', 'test', 'tests', 'sample', 'samples',
-                                  '.thumbnails', 'thumbnails', 'covers', 'images', 'artwork', 'art',
-                                  'extras', 'bonus', 'misc', 'other', 'various', 'unknown', 'unsorted',
-                                  'downloads', 'incoming', 'processing', 'completed', 'done', 'failed',
-                                  'streams', 'chapters', 'parts', '.streams', '.cache', '.metadata'}
-                if title.lower() in system_folders or title.startswith('.'):
+                if title.lower() in _SCAN_SKIP_BOOK_FOLDERS or title.startswith('.'):
                     logger.debug(f"Skipping system folder: {path}")
                     continue
 
                 # Check if this is a SERIES folder containing multiple book subfolders
                 # If so, skip it - we should process the books inside, not the series folder itself
-                subdirs = [d for d in title_dir.iterdir() if d.is_dir()]
+                subdirs, title_files = _split_dir_entries(title_dir)
                 if len(subdirs) >= 2:
                     # Count how many look like book folders (numbered, "Book N", etc.)
-                    book_folder_patterns = [
-                        r'^\d+\s*[-–—:.]?\s*\w',     # "01 Title", "1 - Title", "01. Title"
-                        r'^#?\d+\s*[-–—:]',          # "#1 - Title"
-                        r'book\s*\d+',               # "Book 1", "Book1"
-                        r'vol(ume)?\s*\d+',          # "Volume 1", "Vol 1"
-                        r'part\s*\d+',               # "Part 1"
-                    ]
-                    book_like_count = sum(
-                        1 for d in subdirs
-                        if any(re.search(p, d.name, re.IGNORECASE) for p in book_folder_patterns)
-                    )
+                    book_like_count = sum(1 for d in subdirs if _BOOK_FOLDER_RE.search(d.name))
                     if book_like_count >= 2:
                         # This is a series folder, not a book - skip it
                         logger.info(f"Skipping series folder (contains {book_like_count} book subfolders): {path}")
                         # Mark in database as series_folder so we don't keep checking it
-                        c.execute('SELECT id FROM books WHERE path = ?', (path,))
-                        existing = c.fetchone()
-                        if existing:
-                            c.execute('UPDATE books SET status = ? WHERE id = ?', ('series_folder', existing['id']))
-                        else:
-                            c.execute('''INSERT INTO books (path, current_author, current_title, status)
-                                         VALUES (?, ?, ?, 'series_folder')''', (path, author, title))
-                        conn.commit()
+                        skipped_folder_rows.append((path, author, title, 'series_folder'))
                         continue
 
                 # Check if this folder contains multiple AUDIO FILES that look like different books
                 # (e.g., "Book 1.m4b", "Book 2.m4b" or "Necroscope Book 1.m4b", "Necroscope Book 2.m4b")
-                audio_files = [f for f in title_dir.iterdir()
-                               if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS]
+                audio_files = [f for f in title_files if is_audio_filename(f.name)]
                 if len(audio_files) >= 2:
                     # Check if filenames indicate different book numbers
-                    book_file_patterns = [
-                        r'book\s*(\d+)',           # "Book 1", "Book 2"
-                        r'#(\d+)',                 # "#1", "#2"
-                        r'^(\d+)\s*[-–—:.]',       # "01 - Title", "02 - Title"
-                        r'[-_\s](\d+)[-_\s.]',     # " 1 ", "_1_", "-1-"
-                        r'volume\s*(\d+)',         # "Volume 1"
-                        r'vol\.?\s*(\d+)',         # "Vol 1", "Vol. 1"
-                    ]
-                    book_numbers_found = set()
-                    for f in audio_files:
-                        for pattern in book_file_patterns:
-                            match = re.search(pattern, f.stem, re.IGNORECASE)
-                            if match:
-                                book_numbers_found.add(match.group(1))
-                                break
+                    book_numbers_found = _book_numbers_in_files(audio_files)
 
                     if len(book_numbers_found) >= 2:
                         # Multiple different book numbers found - this is a multi-book collection
                         logger.info(f"Skipping multi-book collection (contains {len(book_numbers_found)} book files): {path}")
-                        c.execute('SELECT id FROM books WHERE path = ?', (path,))
-                        existing = c.fetchone()
-                        if existing:
-                            c.execute('UPDATE books SET status = ? WHERE id = ?', ('multi_book_files', existing['id']))
-                        else:
-                            c.execute('''INSERT INTO books (path, current_author, current_title, status)
-                                         VALUES (?, ?, ?, 'multi_book_files')''', (path, author, title))
-                        conn.commit()
+                        skipped_folder_rows.append((path, author, title, 'multi_book_files'))
                         continue
 
                 # This is a valid book folder - count it
@@ -3711,17 +4661,11 @@ def deep_scan_library(config):
 
                 # CRITICAL: Detect REVERSED STRUCTURE (Series/Author instead of Author/Series)
                 # When: author folder looks like a title AND title folder looks like an author
-                author_looks_like_title = any(i in author_issues for i in [
-                    'year_in_author', 'title_words_in_author', 'author_contains_book_number',
-                    'not_a_name_pattern', 'author_starts_with_number'
-                ])
+                author_looks_like_title = not _AUTHOR_LOOKS_LIKE_TITLE_ISSUES.isdisjoint(author_issues)
                 title_looks_like_author = 'title_looks_like_author' in title_issues
 
                 # Check if title folder is a proper name pattern (First Last)
-                title_is_name_pattern = bool(re.match(
-                    r'^[A-Z][a-z]+\s+[A-Z][a-z]+$|^[A-Z]\.\s*[A-Z][a-z]+$|^[A-Z][a-z]+,\s+[A-Z]',
-                    title
-                ))
+                title_is_name_pattern = bool(_TITLE_NAME_PATTERN_RE.match(title))
 
                 if author_looks_like_title and (title_looks_like_author or title_is_name_pattern):
                     # This is a reversed structure! Mark it specially
@@ -3729,54 +4673,40 @@ def deep_scan_library(config):
                     logger.info(f"Detected reversed structure: '{author}' is title, '{title}' is author")
 
                     # Set status to 'structure_reversed' so we handle it differently
-                    c.execute('SELECT id FROM books WHERE path = ?', (path,))
-                    existing_rev = c.fetchone()
-                    if existing_rev:
-                        c.execute('UPDATE books SET status = ? WHERE id = ?',
-                                  ('structure_reversed', existing_rev['id']))
-                    else:
-                        c.execute('''INSERT INTO books (path, current_author, current_title, status)
-                                     VALUES (?, ?, ?, 'structure_reversed')''', (path, author, title))
-                    conn.commit()
+                    skipped_folder_rows.append((path, author, title, 'structure_reversed'))
                     # Don't add to regular queue - needs special handling
                     continue
 
                 # Check for nested structure (disc folders inside book folder)
-                nested_dirs = [d for d in title_dir.iterdir() if d.is_dir()]
-                disc_dirs = [d for d in nested_dirs if is_disc_chapter_folder(d.name)]
+                disc_dirs = [d for d in subdirs if is_disc_chapter_folder(d.name)]
                 if disc_dirs:
                     all_issues.append(f"has_{len(disc_dirs)}_disc_folders")
 
                 # Check for ebook files
-                ebook_files = [f for f in title_dir.rglob('*') if f.suffix.lower() in EBOOK_EXTENSIONS]
-                audio_in_folder = [f for f in title_dir.rglob('*') if f.suffix.lower() in AUDIO_EXTENSIONS]
+                counts = title_file_counts.get(path)
+                ebook_count, audio_in_folder = counts if counts is not None else _count_book_files(title_dir)
 
-                if ebook_files:
+                if ebook_count:
                     if audio_in_folder:
                         # Mixed folder - ebooks with audiobooks
-                        all_issues.append(f"has_{len(ebook_files)}_ebook_files")
+                        all_issues.append(f"has_{ebook_count}_ebook_files")
                     elif config.get('ebook_management', False):
                         # Ebook-only folder - queue for ebook organization
                         all_issues.append('ebook_only_folder')
-                        logger.info(f"Found ebook-only folder: {path} ({len(ebook_files)} ebooks)")
+                        logger.info(f"Found ebook-only folder: {path} ({ebook_count} ebooks)")
 
                 # Store issues
                 if all_issues:
                     issues_found[path] = all_issues
 
                 # Add to database
-                c.execute('SELECT id, status FROM books WHERE path = ?', (path,))
-                existing = c.fetchone()
+                existing = known_books.get(path)  # (id, status)
 
                 if existing:
-                    if existing['status'] in ['verified', 'fixed']:
+                    if existing[1] in ('verified', 'fixed'):
                         continue
-                    book_id = existing['id']
                 else:
-                    c.execute('''INSERT INTO books (path, current_author, current_title, status)
-                                 VALUES (?, ?, ?, 'pending')''', (path, author, title))
-                    conn.commit()
-                    book_id = c.lastrowid
+                    new_book_rows.append((path, author, title, 'pending'))
                     scanned += 1
 
                 # Add to queue if has issues
@@ -3784,36 +4714,65 @@ def deep_scan_library(config):
                     # Skip multi-book collections - they need manual splitting, not renaming
                     if 'multi_book_collection' in all_issues:
                         logger.info(f"Skipping multi-book collection (needs manual split): {path}")
-                        c.execute('UPDATE books SET status = ? WHERE id = ?',
-                                  ('needs_split', book_id))
-                        conn.commit()
+                        status_rows.append(('needs_split', path))
                         continue
 
                     reason = "; ".join(all_issues[:3])  # First 3 issues
                     if len(all_issues) > 3:
                         reason += f" (+{len(all_issues)-3} more)"
 
-                    c.execute('SELECT id FROM queue WHERE book_id = ?', (book_id,))
-                    if not c.fetchone():
-                        c.execute('''INSERT INTO queue (book_id, reason, priority)
-                                    VALUES (?, ?, ?)''',
-                                 (book_id, reason, min(len(all_issues), 10)))
-                        conn.commit()
-                        queued += 1
+                    if existing and existing[0] in queued_book_ids:
+                        continue
+                    queue_rows.append((reason, min(len(all_issues), 10), path))
+                    queued += 1
+
+        # Write this library's books and queue entries in one transaction
+        with conn:
+            c.executemany('''INSERT OR IGNORE INTO books (path, current_author, current_title, status)
+                             VALUES (?, ?, ?, ?)''', new_book_rows)
+            c.executemany('''INSERT INTO queue (book_id, reason, added_at, priority)
+                             SELECT id, ?, ?, ? FROM books WHERE path = ?''', loose_queue_rows)
+            c.executemany('''UPDATE queue SET reason = ?, added_at = ?, priority = ?
+                             WHERE book_id = ?''', requeue_rows)
+            c.executemany('''INSERT INTO queue (book_id, reason, priority)
+                             SELECT id, ?, ? FROM books WHERE path = ?''', queue_rows)
+            c.executemany('UPDATE books SET status = ? WHERE path = ?', status_rows)
+        new_book_rows, loose_queue_rows, requeue_rows, queue_rows, status_rows = [], [], [], [], []
+
+        if skipped_folder_rows:
+            # Existing rows only get the new status - author/title may come from an earlier fix
+            upsert_books(conn, skipped_folder_rows, update_names=False, update_status=True)
+            skipped_folder_rows = []
 
     # Third pass: Flag duplicates
     logger.info("Checking for duplicates...")
     duplicate_count = 0
 
+    # Unique sizes can't be duplicates, so only files sharing a size get read.
+    # Those reads are independent seeks, so they're overlapped on a thread pool;
+    # map() keeps the results in candidate order.
+    candidates = [(audio_file, size) for size, paths in size_buckets.items() if len(paths) > 1
+                  for audio_file in paths]
+    file_signatures = {}  # signature -> list of paths
+    if candidates:
+        try:
+            workers = int(config.get('scan_workers', DEEP_SCAN_HASH_WORKERS))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid scan_workers value {config.get('scan_workers')!r}, using {DEEP_SCAN_HASH_WORKERS}")
+            workers = DEEP_SCAN_HASH_WORKERS
+        workers = max(1, min(workers, len(candidates)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            signatures = pool.map(lambda item: get_file_signature(item[0], size=item[1]), candidates)
+            for (audio_file, _), sig in zip(candidates, signatures):
+                if sig:
+                    file_signatures.setdefault(sig, []).append(audio_file)
+
     for sig, paths in file_signatures.items():
         if len(paths) > 1:
             duplicate_count += 1
             for p in paths:
-                book_dir = str(Path(p).parent)
-                if book_dir in issues_found:
-                    issues_found[book_dir].append(f"duplicate_file:{os.path.basename(p)}")
-                else:
-                    issues_found[book_dir] = [f"duplicate_file:{os.path.basename(p)}"]
+                book_dir, filename = os.path.split(p)
+                issues_found.setdefault(book_dir, []).append(f"duplicate_file:{filename}")
 
     logger.info(f"Found {duplicate_count} potential duplicate file sets")
 
@@ -3838,7 +4797,9 @@ def deep_scan_library(config):
 
 def scan_library(config):
     """Wrapper that calls deep scan."""
-    return deep_scan_library(config)
+    result = deep_scan_library(config)
+    mark_stats_dirty()
+    return result
 
 def check_rate_limit(config):
     """Check if we're within API rate limits. Returns (allowed, calls_this_hour, limit)."""
@@ -3863,6 +4824,12 @@ def check_rate_limit(config):
     return allowed, calls_today, max_per_hour
 
 
+# Words (matched anywhere, lowercased) that mark an "author" folder as really being a series name
+_SERIES_INDICATOR_RE = _any_of(re.escape(w) for w in (
+    'series', 'saga', 'cycle', 'chronicles', 'trilogy', 'collection',
+    'edition', 'novels', 'books', 'tales', 'adventures', 'mysteries'))
+
+
 def process_queue(config, limit=None):
     """Process items in the queue."""
     # Check rate limit first
@@ -3909,7 +4876,8 @@ def process_queue(config, limit=None):
     # Update API call stats (INSERT if not exists, then UPDATE to preserve other columns)
     today = datetime.now().strftime('%Y-%m-%d')
     c.execute('INSERT OR IGNORE INTO stats (date) VALUES (?)', (today,))
-    c.execute('UPDATE stats SET api_calls = COALESCE(api_calls, 0) + 1 WHERE date = ?', (today,))
+    ai_calls = -(-len(messy_names) // AI_CHUNK_SIZE)  # One AI call per prompt chunk
+    c.execute('UPDATE stats SET api_calls = COALESCE(api_calls, 0) + ? WHERE date = ?', (ai_calls, today))
 
     if not results:
         logger.warning("No results from AI")
@@ -3925,14 +4893,9 @@ def process_queue(config, limit=None):
         old_path = Path(row['path'])
         if old_path.exists() and old_path.is_dir():
             # Check for multiple book SUBFOLDERS
-            subdirs = [d for d in old_path.iterdir() if d.is_dir()]
+            subdirs, files = _split_dir_entries(old_path)
             if len(subdirs) >= 2:
-                book_folder_patterns = [
-                    r'^\d+\s*[-–—:.]?\s*\w', r'^#?\d+\s*[-–—:]',
-                    r'book\s*\d+', r'vol(ume)?\s*\d+', r'part\s*\d+'
-                ]
-                book_like_count = sum(1 for d in subdirs
-                    if any(re.search(p, d.name, re.IGNORECASE) for p in book_folder_patterns))
+                book_like_count = sum(1 for d in subdirs if _BOOK_FOLDER_RE.search(d.name))
                 if book_like_count >= 2:
                     logger.warning(f"BLOCKED: {row['path']} is a series folder ({book_like_count} book subfolders) - skipping")
                     c.execute('UPDATE books SET status = ? WHERE id = ?', ('series_folder', row['book_id']))
@@ -3941,20 +4904,9 @@ def process_queue(config, limit=None):
                     continue
 
             # Check for multiple book FILES
-            audio_files = [f for f in old_path.iterdir()
-                           if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS]
+            audio_files = [f for f in files if is_audio_filename(f.name)]
             if len(audio_files) >= 2:
-                book_file_patterns = [
-                    r'book\s*(\d+)', r'#(\d+)', r'^(\d+)\s*[-–—:.]',
-                    r'[-_\s](\d+)[-_\s.]', r'volume\s*(\d+)', r'vol\.?\s*(\d+)'
-                ]
-                book_numbers = set()
-                for f in audio_files:
-                    for pattern in book_file_patterns:
-                        match = re.search(pattern, f.stem, re.IGNORECASE)
-                        if match:
-                            book_numbers.add(match.group(1))
-                            break
+                book_numbers = _book_numbers_in_files(audio_files)
                 if len(book_numbers) >= 2:
                     logger.warning(f"BLOCKED: {row['path']} contains {len(book_numbers)} different book files - skipping")
                     c.execute('UPDATE books SET status = ? WHERE id = ?', ('multi_book_files', row['book_id']))
@@ -3988,9 +4940,7 @@ def process_queue(config, limit=None):
                 if extracted_num and not new_series:
                     original_author = row['current_author']
                     # Check if original author looks like a series name
-                    series_indicators = ['series', 'saga', 'cycle', 'chronicles', 'trilogy', 'collection',
-                                         'edition', 'novels', 'books', 'tales', 'adventures', 'mysteries']
-                    if any(ind in original_author.lower() for ind in series_indicators):
+                    if _SERIES_INDICATOR_RE.search(original_author.lower()):
                         new_series = original_author
                         new_series_num = extracted_num
                         logger.info(f"Using original author as series: '{new_series}' #{new_series_num}")
@@ -4327,6 +5277,7 @@ def process_queue(config, limit=None):
 
     conn.commit()
     conn.close()
+    mark_stats_dirty()
 
     logger.info(f"[DEBUG] Batch complete: {processed} processed, {fixed} fixed")
     return processed, fixed
@@ -4376,6 +5327,7 @@ def apply_fix(history_id):
         c.execute('UPDATE history SET status = ?, error_message = ? WHERE id = ?',
                  ('error', error_msg, history_id))
         conn.commit()
+        mark_stats_dirty()
         conn.close()
         return False, error_msg
 
@@ -4389,6 +5341,7 @@ def apply_fix(history_id):
                 c.execute('UPDATE history SET status = ?, error_message = ? WHERE id = ?',
                          ('error', error_msg, history_id))
                 conn.commit()
+                mark_stats_dirty()
                 conn.close()
                 return False, error_msg
             break
@@ -4400,6 +5353,7 @@ def apply_fix(history_id):
         c.execute('UPDATE history SET status = ?, error_message = ? WHERE id = ?',
                  ('error', error_msg, history_id))
         conn.commit()
+        mark_stats_dirty()
         conn.close()
         return False, error_msg
 
@@ -4426,6 +5380,7 @@ def apply_fix(history_id):
                 c.execute('UPDATE history SET status = ?, error_message = ? WHERE id = ?',
                          ('error', error_msg, history_id))
                 conn.commit()
+                mark_stats_dirty()
                 conn.close()
                 return False, error_msg
 
@@ -4443,6 +5398,7 @@ def apply_fix(history_id):
                 c.execute('UPDATE history SET status = ?, error_message = ? WHERE id = ?',
                          ('error', error_msg, history_id))
                 conn.commit()
+                mark_stats_dirty()
                 conn.close()
                 return False, error_msg
             else:
@@ -4508,6 +5464,7 @@ def apply_fix(history_id):
                      (embed_status, embed_error, history_id))
 
         conn.commit()
+        mark_stats_dirty()
         conn.close()
         return True, "Fix applied successfully"
     except Exception as e:
@@ -4515,6 +5472,7 @@ def apply_fix(history_id):
         c.execute('UPDATE history SET status = ?, error_message = ? WHERE id = ?',
                  ('error', error_msg, history_id))
         conn.commit()
+        mark_stats_dirty()
         conn.close()
         return False, error_msg
 
@@ -4524,6 +5482,82 @@ worker_thread = None
 worker_running = False
 processing_status = {"active": False, "processed": 0, "total": 0, "current": "", "errors": []}
 
+# ============== STATS CACHE ==============
+# /api/stats is polled by every open page. Serve it from memory and let a
+# refresher thread re-run the counts when something marks them dirty, so the
+# UI never competes with the worker for the SQLite lock.
+
+STATS_MAX_AGE = 30  # Seconds - refresh at least this often even if nothing marked dirty
+STATS_FIRST_FILL_WAIT = 5  # Seconds a request waits for the first counts before serving zeros
+
+_stats_cache = {
+    'total_books': 0,
+    'queue_size': 0,
+    'fixed': 0,
+    'pending_fixes': 0,
+    'verified': 0,
+    'structure_reversed': 0
+}
+_stats_lock = threading.Lock()
+_stats_dirty = threading.Event()
+_stats_ready = threading.Event()  # Set once the cache holds real counts
+_stats_thread = None
+
+def mark_stats_dirty():
+    """Signal that books/queue/history changed and cached stats need a refresh."""
+    _stats_dirty.set()
+
+def refresh_stats_cache():
+    """Recount all dashboard stats in a single query and update the cache."""
+    conn = get_db()
+    try:
+        c = conn.cursor()
+        c.execute('''SELECT
+                     (SELECT COUNT(*) FROM books) as total_books,
+                     (SELECT COUNT(*) FROM queue) as queue_size,
+                     (SELECT COUNT(*) FROM books WHERE status = 'fixed') as fixed,
+                     (SELECT COUNT(*) FROM history WHERE status = 'pending_fix') as pending_fixes,
+                     (SELECT COUNT(*) FROM books WHERE status = 'verified') as verified,
+                     (SELECT COUNT(*) FROM books WHERE status = 'structure_reversed') as structure_reversed''')
+        counts = dict(c.fetchone())
+    finally:
+        conn.close()
+
+    with _stats_lock:
+        _stats_cache.update(counts)
+
+def _stats_refresher():
+    """Daemon loop: refresh cached stats when dirty (or every STATS_MAX_AGE seconds)."""
+    while True:
+        # Clear before querying so writes that land mid-refresh trigger another pass
+        _stats_dirty.clear()
+        try:
+            refresh_stats_cache()
+            _stats_ready.set()
+        except Exception as e:
+            logger.debug(f"Stats refresh failed: {e}")
+        _stats_dirty.wait(STATS_MAX_AGE)
+
+def get_cached_stats():
+    """Return a copy of the cached stats, starting the refresher on first use."""
+    global _stats_thread
+
+    if _stats_thread is None:
+        with _stats_lock:
+            if _stats_thread is None:
+                _stats_thread = threading.Thread(target=_stats_refresher, daemon=True)
+                _stats_thread.start()
+
+    if not _stats_ready.is_set():
+        # The refresher fills the cache as soon as it starts. Until that has worked once,
+        # every caller waits for it (and nudges a retry if the last attempt failed)
+        # instead of serving zeros.
+        mark_stats_dirty()
+        _stats_ready.wait(STATS_FIRST_FILL_WAIT)
+
+    with _stats_lock:
+        return dict(_stats_cache)
+
 def process_all_queue(config):
     """Process ALL items in the queue in batches, respecting rate limits."""
     global processing_status
@@ -4798,6 +5832,7 @@ def settings_page():
         config['max_requests_per_hour'] = int(request.form.get('max_requests_per_hour', 30))
         config['auto_fix'] = 'auto_fix' in request.form
         config['protect_author_changes'] = 'protect_author_changes' in request.form
+        config['parallel_lookup'] = 'parallel_lookup' in request.form
         config['enabled'] = 'enabled' in request.form
         config['series_grouping'] = 'series_grouping' in request.form
         config['ebook_management'] = 'ebook_management' in request.form
@@ -5089,6 +6124,7 @@ def api_deep_rescan():
 
     conn.commit()
     conn.close()
+    mark_stats_dirty()
 
     msg = f'Queued {queued} books for fresh metadata verification'
     if protected_count > 0:
@@ -5279,6 +6315,7 @@ def api_reject_fix(history_id):
 
     conn.commit()
     conn.close()
+    mark_stats_dirty()
 
     logger.info(f"Rejected fix {history_id}, book {book_id} marked as verified")
     return jsonify({'success': True})
@@ -5305,6 +6342,7 @@ def api_dismiss_error(history_id):
 
     conn.commit()
     conn.close()
+    mark_stats_dirty()
 
     logger.info(f"Dismissed error entry {history_id}")
     return jsonify({'success': True})
@@ -5347,6 +6385,7 @@ def api_remove_from_queue(queue_id):
         c.execute('DELETE FROM queue WHERE id = ?', (queue_id,))
         c.execute('UPDATE books SET status = ? WHERE id = ?', ('verified', row['book_id']))
         conn.commit()
+        mark_stats_dirty()
 
     conn.close()
     return jsonify({'success': True})
@@ -5426,6 +6465,7 @@ def api_undo_all_drastic():
 
     conn.commit()
     conn.close()
+    mark_stats_dirty()
 
     return jsonify({
         'success': True,
@@ -5435,12 +6475,12 @@ def api_undo_all_drastic():
     })
 
 @app.route('/api/undo/<int:history_id>', methods=['POST'])
-def api_undo(history_id):
+@with_db
+def api_undo(conn, history_id):
     """Undo a fix - rename folder back to original name and restore original tags."""
     import shutil
     from audio_tagging import restore_tags_from_sidecar
 
-    conn = get_db()
     c = conn.cursor()
 
     # Get the history record
@@ -5448,7 +6488,6 @@ def api_undo(history_id):
     record = c.fetchone()
 
     if not record:
-        conn.close()
         return jsonify({'success': False, 'error': 'History record not found'}), 404
 
     old_path = record['old_path']
@@ -5456,7 +6495,6 @@ def api_undo(history_id):
 
     # Check if the new_path exists (current location)
     if not os.path.exists(new_path):
-        conn.close()
         return jsonify({
             'success': False,
             'error': f'Current path not found: {new_path}'
@@ -5464,7 +6502,6 @@ def api_undo(history_id):
 
     # Check if old_path already exists (would cause conflict)
     if os.path.exists(old_path):
-        conn.close()
         return jsonify({
             'success': False,
             'error': f'Original path already exists: {old_path}'
@@ -5522,7 +6559,7 @@ def api_undo(history_id):
                   (record['old_author'], record['old_title'], old_path, record['book_id']))
 
         conn.commit()
-        conn.close()
+        mark_stats_dirty()
 
         return jsonify({
             'success': True,
@@ -5531,61 +6568,29 @@ def api_undo(history_id):
         })
 
     except Exception as e:
-        conn.close()
         logger.error(f"Undo failed: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/stats')
 def api_stats():
-    """Get current stats."""
-    conn = get_db()
-    c = conn.cursor()
-
-    c.execute('SELECT COUNT(*) as count FROM books')
-    total = c.fetchone()['count']
-
-    c.execute('SELECT COUNT(*) as count FROM queue')
-    queue = c.fetchone()['count']
-
-    c.execute("SELECT COUNT(*) as count FROM books WHERE status = 'fixed'")
-    fixed = c.fetchone()['count']
-
-    c.execute("SELECT COUNT(*) as count FROM history WHERE status = 'pending_fix'")
-    pending = c.fetchone()['count']
-
-    c.execute("SELECT COUNT(*) as count FROM books WHERE status = 'verified'")
-    verified = c.fetchone()['count']
-
-    c.execute("SELECT COUNT(*) as count FROM books WHERE status = 'structure_reversed'")
-    structure_reversed = c.fetchone()['count']
-
-    conn.close()
-
-    return jsonify({
-        'total_books': total,
-        'queue_size': queue,
-        'fixed': fixed,
-        'pending_fixes': pending,
-        'verified': verified,
-        'structure_reversed': structure_reversed,
-        'worker_running': is_worker_running(),
-        'processing': processing_status
-    })
+    """Get current stats (served from the in-memory stats cache)."""
+    stats = get_cached_stats()
+    stats['worker_running'] = is_worker_running()
+    stats['processing'] = processing_status
+    return jsonify(stats)
 
 @app.route('/api/queue')
-def api_queue():
+@with_db
+def api_queue(conn):
     """Get current queue items as JSON."""
-    conn = get_db()
     c = conn.cursor()
 
-    c.execute('''SELECT q.id, q.reason, q.added_at,
-                        b.id as book_id, b.path, b.current_author, b.current_title
-                 FROM queue q
-                 JOIN books b ON q.book_id = b.id
-                 ORDER BY q.priority, q.added_at''')
-    items = [dict(row) for row in c.fetchall()]
+    items = fetch_dicts(c, '''SELECT q.id, q.reason, q.added_at,
+                                b.id as book_id, b.path, b.current_author, b.current_title
+                         FROM queue q
+                         JOIN books b ON q.book_id = b.id
+                         ORDER BY q.priority, q.added_at''')
 
-    conn.close()
     return jsonify({'items': items, 'count': len(items)})
 
 @app.route('/api/analyze_path', methods=['POST'])
@@ -5631,9 +6636,9 @@ def api_analyze_path():
 
 
 @app.route('/api/structure_reversed')
-def api_structure_reversed():
+@with_db
+def api_structure_reversed(conn):
     """Get items with reversed folder structure (Series/Author instead of Author/Series)."""
-    conn = get_db()
     c = conn.cursor()
 
     c.execute('''SELECT id, path, current_author, current_title
@@ -5650,14 +6655,13 @@ def api_structure_reversed():
             'suggestion': f"Move to: {row['current_title']}/{row['current_author']}"
         })
 
-    conn.close()
     return jsonify({'items': items, 'count': len(items)})
 
 
 @app.route('/api/structure_reversed/fix/<int:book_id>', methods=['POST'])
-def api_fix_structure_reversed(book_id):
+@with_db
+def api_fix_structure_reversed(conn, book_id):
     """Fix a reversed structure by swapping author/title in the path."""
-    conn = get_db()
     c = conn.cursor()
 
     c.execute('SELECT * FROM books WHERE id = ?', (book_id,))
@@ -5680,6 +6684,7 @@ def api_fix_structure_reversed(book_id):
         if not old_path.exists():
             c.execute('UPDATE books SET status = ? WHERE id = ?', ('missing', book_id))
             conn.commit()
+            mark_stats_dirty()
             return jsonify({'success': False, 'error': 'Source path no longer exists'}), 400
 
         # Create target directory if needed
@@ -5698,6 +6703,7 @@ def api_fix_structure_reversed(book_id):
                      WHERE id = ?''',
                   (str(new_path), detected_author, detected_series, book_id))
         conn.commit()
+        mark_stats_dirty()
 
         logger.info(f"Fixed reversed structure: {old_path} -> {new_path}")
 
@@ -5712,8 +6718,6 @@ def api_fix_structure_reversed(book_id):
     except Exception as e:
         logger.error(f"Failed to fix reversed structure: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        conn.close()
 
 
 @app.route('/api/worker/start', methods=['POST'])
@@ -5729,16 +6733,34 @@ def api_stop_worker():
     return jsonify({'success': True})
 
 
+def _tail_lines(path, n, block_size=8192):
+    """Return the last n lines of a text file without reading the whole file.
+
+    Reads fixed-size blocks backwards from the end until enough newlines are
+    found, so cost is bounded by the tail size rather than the log size.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b''
+        while pos > 0 and data.count(b'\n') <= n:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+    lines = data.decode('utf-8', errors='replace').splitlines()
+    return lines[-n:]
+
+
 @app.route('/api/logs')
 def api_logs():
     """Get recent log entries."""
     try:
         log_file = BASE_DIR / 'app.log'
         if log_file.exists():
-            with open(log_file, 'r') as f:
-                # Read last 100 lines
-                lines = f.readlines()[-100:]
-                return jsonify({'logs': [line.strip() for line in lines]})
+            # Read last 100 lines
+            lines = _tail_lines(log_file, 100)
+            return jsonify({'logs': [line.strip() for line in lines]})
         return jsonify({'logs': []})
     except Exception as e:
         return jsonify({'logs': [f'Error reading logs: {e}']})
@@ -5747,12 +6769,16 @@ def api_logs():
 @app.route('/api/clear_history', methods=['POST'])
 def api_clear_history():
     """Clear all history entries."""
+    # Opening the connection is inside the try so a DB failure still answers with JSON
     try:
         conn = get_db()
-        c = conn.cursor()
-        c.execute('DELETE FROM history')
-        conn.commit()
-        conn.close()
+        try:
+            c = conn.cursor()
+            c.execute('DELETE FROM history')
+            conn.commit()
+        finally:
+            conn.close()
+        mark_stats_dirty()
         logger.info("History cleared by user")
         return jsonify({'success': True, 'message': 'History cleared'})
     except Exception as e:
@@ -5762,15 +6788,20 @@ def api_clear_history():
 @app.route('/api/reset_database', methods=['POST'])
 def api_reset_database():
     """Reset entire database - DANGER!"""
+    # Opening the connection is inside the try so a DB failure still answers with JSON
     try:
         conn = get_db()
-        c = conn.cursor()
-        c.execute('DELETE FROM queue')
-        c.execute('DELETE FROM history')
-        c.execute('DELETE FROM books')
-        c.execute('DELETE FROM stats')
-        conn.commit()
-        conn.close()
+        try:
+            c = conn.cursor()
+            c.execute('DELETE FROM queue')
+            c.execute('DELETE FROM history')
+            c.execute('DELETE FROM books')
+            c.execute('DELETE FROM stats')
+            c.execute('DELETE FROM api_cache')
+            conn.commit()
+        finally:
+            conn.close()
+        mark_stats_dirty()
         logger.warning("DATABASE RESET by user!")
         return jsonify({'success': True, 'message': 'Database reset complete'})
     except Exception as e:
@@ -5778,15 +6809,13 @@ def api_reset_database():
 
 
 @app.route('/api/recent_history')
-def api_recent_history():
+@with_db
+def api_recent_history(conn):
     """Get recent history items for live updates."""
-    conn = get_db()
     c = conn.cursor()
-    c.execute('''SELECT h.*, b.path FROM history h
-                 JOIN books b ON h.book_id = b.id
-                 ORDER BY h.fixed_at DESC LIMIT 15''')
-    items = [dict(row) for row in c.fetchall()]
-    conn.close()
+    items = fetch_dicts(c, '''SELECT h.*, b.path FROM history h
+                         JOIN books b ON h.book_id = b.id
+                         ORDER BY h.fixed_at DESC LIMIT 15''')
     return jsonify({'items': items})
 
 
@@ -5797,7 +6826,7 @@ def api_orphans():
     orphans = []
 
     for lib_path in config.get('library_paths', []):
-        lib_orphans = find_orphan_audio_files(lib_path)
+        lib_orphans = find_orphan_audio_files_cached(lib_path)
         orphans.extend(lib_orphans)
 
     return jsonify({
@@ -5819,6 +6848,7 @@ def api_organize_orphan():
 
     config = load_config()
     success, message = organize_orphan_files(author_path, book_title, files, config)
+    invalidate_orphan_cache()
 
     return jsonify({
         'success': success,
@@ -5855,6 +6885,8 @@ def api_organize_all_orphans():
                 results['errors'] += 1
                 results['details'].append(f"Error: {orphan['author']}: {message}")
 
+        invalidate_orphan_cache(lib_path)
+
     return jsonify({
         'success': True,
         'organized': results['organized'],
@@ -5863,20 +6895,76 @@ def api_organize_all_orphans():
     })
 
 
+# Version info never changes while the process runs - encode it once
+_VERSION_RESPONSE_BODY = json.dumps({'version': APP_VERSION, 'repo': GITHUB_REPO}).encode('utf-8')
+
 @app.route('/api/version')
 def api_version():
     """Return current app version."""
-    return jsonify({
-        'version': APP_VERSION,
-        'repo': GITHUB_REPO
-    })
+    resp = Response(_VERSION_RESPONSE_BODY, mimetype='application/json')
+    # Short max-age so a restart after an update shows the new version promptly
+    resp.headers['Cache-Control'] = 'public, max-age=300'
+    return resp
+
+# Update check cache: {(channel, local_commit_sha): (checked_at, result)}
+# Every page load asks for an update check, and unauthenticated GitHub API
+# calls are limited to 60/hour, so reuse recent answers instead of blocking
+# each page on a round-trip to GitHub.
+UPDATE_CHECK_TTL = 900  # 15 minutes
+_update_check_cache = {}
+_update_check_lock = threading.Lock()
+
 
 @app.route('/api/check_update')
 def api_check_update():
-    """Check GitHub for newer version based on update channel."""
+    """Check GitHub for newer version based on update channel.
+
+    Pass ?force=1 to bypass the cache (manual "check now" button).
+    """
     config = load_config()
     channel = config.get('update_channel', 'stable')
+    cache_key = (channel, config.get('local_commit_sha', ''))
+    force = request.args.get('force') == '1'
+
+    with _update_check_lock:  # Concurrent page loads share one GitHub request
+        cached = _update_check_cache.get(cache_key)
+        if cached and not force and time.time() - cached[0] < UPDATE_CHECK_TTL:
+            return jsonify(cached[1])
+
+        result = _check_for_update(config, channel)
+        if 'error' not in result:  # Don't pin transient failures for the whole TTL
+            _update_check_cache[cache_key] = (time.time(), result)
 
+    return jsonify(result)
+
+
+def _extract_release_info(data, is_commit=False):
+    """Pull the fields we display out of a GitHub release (or commit) payload."""
+    if is_commit:
+        commit = data.get('commit') or {}
+        try:
+            date = commit['committer']['date'][:10]
+        except (KeyError, TypeError):
+            date = ''
+        return {
+            'version': (data.get('sha') or '')[:7],
+            'url': data.get('html_url') or '',
+            'notes': (commit.get('message') or '')[:200],
+            'date': date,
+            'prerelease': False
+        }
+
+    return {
+        'version': (data.get('tag_name') or '').lstrip('v'),
+        'url': data.get('html_url') or '',
+        'notes': (data.get('body') or '')[:500],
+        'date': (data.get('published_at') or '')[:10],
+        'prerelease': data.get('prerelease', False)
+    }
+
+
+def _check_for_update(config, channel):
+    """Query GitHub for the latest version on a channel. Returns a response dict."""
     try:
         headers = {'Accept': 'application/vnd.github.v3+json'}
 
@@ -5886,40 +6974,37 @@ def api_check_update():
             resp = requests.get(url, timeout=5, headers=headers)
 
             if resp.status_code == 404:
-                return jsonify({
+                return {
                     'update_available': False,
                     'current': APP_VERSION,
                     'channel': channel,
                     'message': 'Repository not found or not published yet'
-                })
+                }
 
             if resp.status_code != 200:
-                return jsonify({
+                return {
                     'update_available': False,
                     'current': APP_VERSION,
                     'channel': channel,
                     'error': f'GitHub API error: {resp.status_code}'
-                })
+                }
 
-            data = resp.json()
-            latest_sha = data.get('sha', '')[:7]
-            commit_msg = data.get('commit', {}).get('message', '')[:200]
-            commit_date = data.get('commit', {}).get('committer', {}).get('date', '')[:10]
-            commit_url = data.get('html_url', '')
+            info = _extract_release_info(resp.json(), is_commit=True)
+            latest_sha = info['version']
 
             # For nightly, check if we have a local commit hash stored
             local_commit = config.get('local_commit_sha', '')
 
-            return jsonify({
+            return {
                 'update_available': latest_sha != local_commit if local_commit else True,
                 'current': APP_VERSION + (f' ({local_commit})' if local_commit else ''),
                 'latest': f'main@{latest_sha}',
-                'latest_date': commit_date,
+                'latest_date': info['date'],
                 'channel': channel,
-                'release_url': commit_url,
-                'release_notes': commit_msg,
+                'release_url': info['url'],
+                'release_notes': info['notes'],
                 'message': 'Tracking latest commits on main branch' if not local_commit else None
-            })
+            }
 
         elif channel == 'beta':
             # Check all releases including pre-releases
@@ -5927,47 +7012,42 @@ def api_check_update():
             resp = requests.get(url, timeout=5, headers=headers)
 
             if resp.status_code == 404:
-                return jsonify({
+                return {
                     'update_available': False,
                     'current': APP_VERSION,
                     'channel': channel,
                     'message': 'No releases found (repo may not be published yet)'
-                })
+                }
 
             if resp.status_code != 200:
-                return jsonify({
+                return {
                     'update_available': False,
                     'current': APP_VERSION,
                     'channel': channel,
                     'error': f'GitHub API error: {resp.status_code}'
-                })
+                }
 
             releases = resp.json()
             if not releases:
-                return jsonify({
+                return {
                     'update_available': False,
                     'current': APP_VERSION,
                     'channel': channel,
                     'message': 'No releases found'
-                })
+                }
 
             # Get the latest release (first in list, includes pre-releases)
-            latest = releases[0]
-            latest_version = latest.get('tag_name', '').lstrip('v')
-            release_url = latest.get('html_url', '')
-            release_notes = latest.get('body', '')[:500]
-            is_prerelease = latest.get('prerelease', False)
+            info = _extract_release_info(releases[0])
+            update_available = _compare_versions(APP_VERSION, info['version'])
 
-            update_available = _compare_versions(APP_VERSION, latest_version)
-
-            return jsonify({
+            return {
                 'update_available': update_available,
                 'current': APP_VERSION,
-                'latest': latest_version + (' (beta)' if is_prerelease else ''),
+                'latest': info['version'] + (' (beta)' if info['prerelease'] else ''),
                 'channel': channel,
-                'release_url': release_url,
-                'release_notes': release_notes if update_available else None
-            })
+                'release_url': info['url'],
+                'release_notes': info['notes'] if update_available else None
+            }
 
         else:  # stable (default)
             # Check only stable releases (not pre-releases)
@@ -5975,55 +7055,50 @@ def api_check_update():
             resp = requests.get(url, timeout=5, headers=headers)
 
             if resp.status_code == 404:
-                return jsonify({
+                return {
                     'update_available': False,
                     'current': APP_VERSION,
                     'channel': channel,
                     'message': 'No releases found (repo may not be published yet)'
-                })
+                }
 
             if resp.status_code != 200:
-                return jsonify({
+                return {
                     'update_available': False,
                     'current': APP_VERSION,
                     'channel': channel,
                     'error': f'GitHub API error: {resp.status_code}'
-                })
-
-            data = resp.json()
-            latest_version = data.get('tag_name', '').lstrip('v')
-            release_url = data.get('html_url', '')
-            release_notes = data.get('body', '')[:500]
+                }
 
-            update_available = _compare_versions(APP_VERSION, latest_version)
+            info = _extract_release_info(resp.json())
+            update_available = _compare_versions(APP_VERSION, info['version'])
 
-            return jsonify({
+            return {
                 'update_available': update_available,
                 'current': APP_VERSION,
-                'latest': latest_version,
+                'latest': info['version'],
                 'channel': channel,
-                'release_url': release_url,
-                'release_notes': release_notes if update_available else None
-            })
+                'release_url': info['url'],
+                'release_notes': info['notes'] if update_available else None
+            }
 
     except Exception as e:
         logger.debug(f"Update check failed: {e}")
-        return jsonify({
+        return {
             'update_available': False,
             'current': APP_VERSION,
             'channel': channel,
             'error': str(e)
-        })
+        }
+
+_VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)')
 
 def _compare_versions(current, latest):
     """Compare semantic versions. Returns True if latest > current."""
     def parse_version(v):
         # Handle versions like "1.0.0-beta.1"
-        import re
-        match = re.match(r'(\d+)\.(\d+)\.(\d+)', v)
-        if match:
-            return tuple(int(x) for x in match.groups())
-        return (0, 0, 0)
+        match = _VERSION_RE.match(v)
+        return tuple(map(int, match.groups())) if match else (0, 0, 0)
 
     return parse_version(latest) > parse_version(current)
 
@@ -6153,32 +7228,29 @@ def api_bug_report():
 
     # Get config (sanitize API keys)
     config = load_config()
-    safe_config = {k: v for k, v in config.items()}
-    if safe_config.get('openrouter_api_key'):
-        safe_config['openrouter_api_key'] = '***REDACTED***'
-    if safe_config.get('gemini_api_key'):
-        safe_config['gemini_api_key'] = '***REDACTED***'
+    safe_config = config.copy()
+    for key in REDACT_KEYS:
+        if safe_config.get(key):
+            safe_config[key] = '***REDACTED***'
 
     # Get database stats
     conn = get_db()
     c = conn.cursor()
-    c.execute('SELECT COUNT(*) as count FROM books')
-    total_books = c.fetchone()['count']
-    c.execute('SELECT COUNT(*) as count FROM queue')
-    queue_size = c.fetchone()['count']
-    c.execute('SELECT COUNT(*) as count FROM history')
-    history_count = c.fetchone()['count']
-    c.execute("SELECT COUNT(*) as count FROM books WHERE status = 'error'")
-    error_count = c.fetchone()['count']
+    c.execute('''SELECT
+                 (SELECT COUNT(*) FROM books) as total,
+                 (SELECT COUNT(*) FROM queue) as queue,
+                 (SELECT COUNT(*) FROM history) as history,
+                 (SELECT COUNT(*) FROM books WHERE status = 'error') as errors''')
+    row = c.fetchone()
+    total_books, queue_size, history_count, error_count = row['total'], row['queue'], row['history'], row['errors']
     conn.close()
 
     # Get recent error/warning logs
     log_file = BASE_DIR / 'app.log'
     recent_errors = []
     if log_file.exists():
-        with open(log_file, 'r') as f:
-            lines = f.readlines()[-200:]
-            recent_errors = [l.strip() for l in lines if 'ERROR' in l or 'WARNING' in l][-30:]
+        lines = _tail_lines(log_file, 200)
+        recent_errors = [l.strip() for l in lines if 'ERROR' in l or 'WARNING' in l][-30:]
 
     # Build report
     report = f"""## Bug Report - Library Manager
@@ -6190,7 +7262,7 @@ def api_bug_report():
 
 ### Configuration
 ```json
-{json.dumps(safe_config, indent=2)}
+{json.dumps(safe_config, indent=2, ensure_ascii=False)}
 ```
 
 ### Database Stats
@@ -7002,6 +8074,7 @@ def api_manual_match():
 
         conn.commit()
         conn.close()
+        mark_stats_dirty()
 
         return jsonify({
             'success': True,
@@ -7081,6 +8154,9 @@ def api_restore():
                 import shutil
                 shutil.copy2(filepath, current_backup_dir / filename)
 
+        # Don't keep idle connections (and their mmap) open on a file we're about to overwrite
+        _db_pool.clear()
+
         # Extract the uploaded backup
         restored = []
         skipped = []
@@ -7103,6 +8179,9 @@ def api_restore():
                 else:
                     skipped.append(filename)
 
+        # Cached dashboard counts still describe the database that was just replaced
+        mark_stats_dirty()
+
         return jsonify({
             'success': True,
             'message': f'Restored {len(restored)} files. Please restart the app to apply changes.',